@@ -55,6 +55,17 @@ result = helpers.distance((0, 0), (3, 4))
 assert abs(result - 5.0) < 0.01, "Distance function failed"
 print(f"  - distance((0,0), (3,4)) = {result} ✓")
 
+result = helpers.distance_sq((0, 0), (3, 4))
+assert result == 25, "Squared distance function failed"
+print(f"  - distance_sq((0,0), (3,4)) = {result} ✓")
+
+from entities.npc import NPC
+npc = NPC("test_npc", "Test", 2, 2)
+edge_x = npc.x + npc.interaction_range
+assert npc.is_in_range(edge_x, npc.y), "NPC range check failed at the boundary"
+assert not npc.is_in_range(edge_x + 1, npc.y), "NPC range check failed past the boundary"
+print(f"  - NPC.is_in_range at range {npc.interaction_range} ✓")
+
 print("✓ Helper functions working!\n")
 
 # Test 4: Resource loader
@@ -172,7 +172,28 @@ try:
     logger.debug(f"Wrapped lines: {text_box.wrapped_lines}")
     assert wrapped_count > 1, "Text should wrap to multiple lines"
     logger.info(f"✓ Text wrapping works ({wrapped_count} lines)")
-    
+
+    # Test appending text (append_text re-wraps only from the last word,
+    # so it must end up exactly where set_text of the whole string does)
+    logger.debug("Testing append_text against set_text...")
+    import random
+    rng = random.Random(1234)
+    pieces = ["word", "a", "longerword", "Supercalifragilisticexpialidocious",
+              " ", "  ", "\n", "\n\n", " \n", "end. ", "trailing   "]
+    for trial in range(200):
+        chunks = ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+                  for _ in range(rng.randint(1, 6))]
+        appended = TextBox(50, 50, 300, 200, chunks[0])
+        for chunk in chunks[1:]:
+            appended.append_text(chunk)
+        expected = TextBox(50, 50, 300, 200)
+        expected.set_text("".join(chunks))
+        assert appended.text == expected.text, f"append_text text differs for {chunks!r}"
+        assert appended.wrapped_lines == expected.wrapped_lines, f"append_text wrapping differs for {chunks!r}"
+        assert appended.max_scroll == expected.max_scroll, f"append_text scroll differs for {chunks!r}"
+    logger.debug("200 random append sequences matched set_text")
+    logger.info("✓ append_text matches set_text")
+
     # Test label
     logger.debug("Creating Label instance...")
     label = Label(100, 100, "Test Label")
@@ -308,6 +329,20 @@ try:
     logger.debug(f"After move_selection(-1): {back_selection}")
     assert back_selection == 0, "Navigation up failed"
     logger.info("✓ Menu navigation works")
+
+    # Test toggling the selection indicator after construction
+    logger.debug("Testing show_indicator toggle...")
+    def render_menu_bytes():
+        indicator_surface = pygame.Surface((800, 600))
+        menu.render(indicator_surface)
+        return pygame.image.tobytes(indicator_surface, "RGB")
+    with_indicator = render_menu_bytes()
+    menu.show_indicator = False
+    without_indicator = render_menu_bytes()
+    menu.show_indicator = True
+    assert without_indicator != with_indicator, "Turning show_indicator off didn't remove the indicator"
+    assert render_menu_bytes() == with_indicator, "Turning show_indicator back on didn't restore it"
+    logger.info("✓ Menu indicator toggle works")
     
     # Test horizontal menu
     logger.debug("Creating HorizontalMenu instance...")
@@ -6,6 +6,7 @@ NPCs that populate islands, provide quests, run shops, and give dialogue.
 import pygame
 from typing import Optional, Dict, Any
 from utils.constants import *
+from utils.helpers import distance_sq
 
 
 class NPC:
@@ -63,10 +64,7 @@ class NPC:
         Returns:
             True if in range
         """
-        dist_x = abs(self.x - player_x)
-        dist_y = abs(self.y - player_y)
-        distance = (dist_x ** 2 + dist_y ** 2) ** 0.5
-        return distance <= self.interaction_range
+        return distance_sq((self.x, self.y), (player_x, player_y)) <= self.interaction_range ** 2
 
     def interact(self) -> Dict[str, Any]:
         """
@@ -339,10 +339,14 @@ class WorldState(State):
             self._render_pause_overlay(surface)
 
         # Render menus (on top of everything)
-        self.party_menu.render(surface)
-        self.inventory_menu.render(surface)
-        self.equipment_menu.render(surface)
-        self.travel_menu.render(surface)
+        if self.party_menu.visible:
+            self.party_menu.render(surface)
+        if self.inventory_menu.visible:
+            self.inventory_menu.render(surface)
+        if self.equipment_menu.visible:
+            self.equipment_menu.render(surface)
+        if self.travel_menu.visible:
+            self.travel_menu.render(surface)
     
     def _render_ui(self, surface: pygame.Surface):
         """Render UI elements."""
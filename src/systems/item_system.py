@@ -26,6 +26,16 @@ class ItemRarity(Enum):
     LEGENDARY = "legendary"
 
 
+# Display color for each rarity
+RARITY_COLORS = {
+    ItemRarity.COMMON: (200, 200, 200),      # Light gray
+    ItemRarity.UNCOMMON: (100, 255, 100),    # Green
+    ItemRarity.RARE: (100, 150, 255),        # Blue
+    ItemRarity.EPIC: (200, 100, 255),        # Purple
+    ItemRarity.LEGENDARY: (255, 200, 50)     # Gold
+}
+
+
 class WeaponType(Enum):
     """Weapon categories."""
     SWORD = "sword"
@@ -152,14 +162,7 @@ class Item:
 
     def get_color(self) -> tuple:
         """Get color based on rarity."""
-        colors = {
-            ItemRarity.COMMON: (200, 200, 200),      # Light gray
-            ItemRarity.UNCOMMON: (100, 255, 100),    # Green
-            ItemRarity.RARE: (100, 150, 255),        # Blue
-            ItemRarity.EPIC: (200, 100, 255),        # Purple
-            ItemRarity.LEGENDARY: (255, 200, 50)     # Gold
-        }
-        return colors.get(self.rarity, (255, 255, 255))
+        return RARITY_COLORS.get(self.rarity, (255, 255, 255))
 
     def __repr__(self) -> str:
         """String representation."""
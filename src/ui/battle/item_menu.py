@@ -7,7 +7,9 @@ import pygame
 from typing import List, Optional, Callable
 from systems.item_system import Item, InventorySlot
 from ui.panel import Panel
+from ui.item_icons import get_item_icon
 from utils.constants import *
+from utils.resource_loader import get_font
 
 
 class BattleItemSlot:
@@ -34,8 +36,8 @@ class BattleItemSlot:
         self.hover_color = LIGHT_GRAY
 
         # Fonts
-        self.name_font = pygame.font.Font(None, 22)
-        self.qty_font = pygame.font.Font(None, 18)
+        self.name_font = get_font(22)
+        self.qty_font = get_font(18)
 
     def set_slot(self, slot: Optional[InventorySlot]):
         """Set the inventory slot to display."""
@@ -77,8 +79,8 @@ class BattleItemSlot:
             icon_size,
             icon_size
         )
-        item_color = self.slot.item.get_color()
-        pygame.draw.rect(surface, item_color, icon_rect)
+        atlas, area = get_item_icon(self.slot.item, icon_size)
+        surface.blit(atlas, icon_rect, area)
 
         # Draw item name
         name_text = self.name_font.render(self.slot.item.name, True, WHITE)
@@ -124,6 +126,7 @@ class BattleItemMenu:
         # Item slots
         self.item_slots: List[BattleItemSlot] = []
         self.usable_items: List[InventorySlot] = []
+        self._slot_rects: List[pygame.Rect] = []
 
         # Selection
         self.selected_index = 0
@@ -134,8 +137,8 @@ class BattleItemMenu:
         self.on_cancel: Optional[Callable[[], None]] = None
 
         # Fonts
-        self.title_font = pygame.font.Font(None, 28)
-        self.desc_font = pygame.font.Font(None, 18)
+        self.title_font = get_font(28)
+        self.desc_font = get_font(18)
 
         # Layout
         self.slot_height = 40
@@ -175,6 +178,24 @@ class BattleItemMenu:
             item_slot.set_slot(slot)
             self.item_slots.append(item_slot)
 
+        self._slot_rects = [item_slot.rect for item_slot in self.item_slots]
+
+    def _slot_index_at(self, x: int, y: int) -> int:
+        """
+        Find the index of the slot under a point.
+
+        The slot rects are tested in one Rect.collidelist call (a C loop)
+        rather than a Python loop over the slots.
+
+        Args:
+            x: X position
+            y: Y position
+
+        Returns:
+            Slot index, or -1 if no slot is under the point
+        """
+        return pygame.Rect(x, y, 1, 1).collidelist(self._slot_rects)
+
     def set_visible(self, visible: bool):
         """Set visibility."""
         self.visible = visible
@@ -223,11 +244,7 @@ class BattleItemMenu:
             mouse_x, mouse_y = event.pos
 
             # Update hover state
-            new_hovered = -1
-            for i, slot in enumerate(self.item_slots):
-                if slot.contains_point(mouse_x, mouse_y):
-                    new_hovered = i
-                    break
+            new_hovered = self._slot_index_at(mouse_x, mouse_y)
 
             if self.hovered_index != new_hovered:
                 # Clear old hover
@@ -243,17 +260,16 @@ class BattleItemMenu:
             mouse_x, mouse_y = event.pos
 
             # Check if clicked on item slot
-            for i, slot in enumerate(self.item_slots):
-                if slot.contains_point(mouse_x, mouse_y):
-                    self.selected_index = i
-                    self._update_selection()
-
-                    # Select item
-                    if 0 <= i < len(self.usable_items):
-                        item = self.usable_items[i].item
-                        if self.on_item_selected:
-                            self.on_item_selected(item)
-                    break
+            i = self._slot_index_at(mouse_x, mouse_y)
+            if i != -1:
+                self.selected_index = i
+                self._update_selection()
+
+                # Select item
+                if i < len(self.usable_items):
+                    item = self.usable_items[i].item
+                    if self.on_item_selected:
+                        self.on_item_selected(item)
 
     def _update_selection(self):
         """Update visual selection state."""
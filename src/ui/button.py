@@ -52,6 +52,9 @@ class Button:
         # Font
         self.font = pygame.font.Font(None, font_size)
         
+        # Rendered labels keyed by (text, color)
+        self._text_surfaces = {}
+        
     def handle_event(self, event):
         """
         Handle pygame events.
@@ -127,10 +130,26 @@ class Button:
         pygame.draw.rect(surface, self.border_color, self.rect, self.border_width)
         
         # Draw text (centered)
-        text_surface = self.font.render(self.text, True, text_color)
+        text_surface = self._get_text_surface(text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
     
+    def _get_text_surface(self, color):
+        """Get the rendered label in the given color, rendering it on first use.
+        
+        Args:
+            color: Text color
+            
+        Returns:
+            pygame.Surface with the label
+        """
+        key = (self.text, color)
+        text_surface = self._text_surfaces.get(key)
+        if text_surface is None:
+            text_surface = self.font.render(self.text, True, color)
+            self._text_surfaces[key] = text_surface
+        return text_surface
+    
     def set_position(self, x, y):
         """Set button position."""
         self.rect.x = x
@@ -144,6 +163,7 @@ class Button:
     def set_text(self, text):
         """Change button text."""
         self.text = text
+        self._text_surfaces.clear()
     
     def set_enabled(self, enabled):
         """Enable or disable the button."""
@@ -217,7 +237,7 @@ class TextButton(Button):
             text_color = self.text_color
         
         # Draw text only
-        text_surface = self.font.render(self.text, True, text_color)
+        text_surface = self._get_text_surface(text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
         
@@ -9,6 +9,7 @@ from typing import Optional
 from entities.character import Character
 from entities.player import Player
 from utils.constants import *
+from utils.resource_loader import get_font
 
 
 class CharacterPreview:
@@ -17,6 +18,13 @@ class CharacterPreview:
     Shows character sprite, name, and Devil Fruit info.
     """
     
+    # Preview tint for each Devil Fruit type
+    FRUIT_COLORS = {
+        "logia": (255, 100, 100),      # Red for Logia
+        "zoan": (255, 200, 100),       # Orange for Zoan
+        "paramecia": (150, 100, 255)   # Purple for Paramecia
+    }
+    
     def __init__(self, x: int, y: int, size: int = 100):
         """
         Initialize character preview.
@@ -38,13 +46,46 @@ class CharacterPreview:
         self.fruit_color = None
         
         # Fonts
-        self.name_font = pygame.font.Font(None, 24)
-        self.fruit_font = pygame.font.Font(None, 18)
+        self.name_font = get_font(24)
+        self.fruit_font = get_font(18)
+        self.letter_font = get_font(20)
+        
+        # Devil Fruit indicator surfaces (built in set_character)
+        self.fruit_icon_radius = 15
+        self._fruit_icon_surface: Optional[pygame.Surface] = None
+        self._fruit_name_surface: Optional[pygame.Surface] = None
+        
+        # Static sprite details, rasterized once
+        self._smile_surface: Optional[pygame.Surface] = None
+        self._hat_surface: Optional[pygame.Surface] = None
+        self._build_sprite_details()
         
         # Animation
         self.bob_offset = 0
         self.bob_speed = 2.0
         self.bob_amplitude = 5
+        self._bob_freq = 0.001 * self.bob_speed  # Radians per millisecond
+    
+    def _build_sprite_details(self):
+        """Rasterize the smile and pirate hat into reusable SRCALPHA surfaces."""
+        third = self.size // 3
+        
+        # Smile
+        self._smile_surface = pygame.Surface(
+            (int(self.size // 1.5), third),
+            pygame.SRCALPHA
+        )
+        pygame.draw.arc(self._smile_surface, WHITE, self._smile_surface.get_rect(), 3.14, 0, 3)
+        
+        # Pirate hat (simple triangle), padded by a pixel for the outline
+        self._hat_surface = pygame.Surface((third * 2 + 3, 23), pygame.SRCALPHA)
+        hat_points = [
+            (third + 1, 1),
+            (1, 21),
+            (third * 2 + 1, 21)
+        ]
+        pygame.draw.polygon(self._hat_surface, BLACK, hat_points)
+        pygame.draw.polygon(self._hat_surface, WHITE, hat_points, 2)
     
     def set_character(self, character: Character):
         """
@@ -57,16 +98,48 @@ class CharacterPreview:
         
         # Set fruit-specific color if applicable
         if character.devil_fruit:
-            fruit_type = character.devil_fruit.fruit_type
-            
-            if fruit_type == "logia":
-                self.fruit_color = (255, 100, 100)  # Red for Logia
-            elif fruit_type == "zoan":
-                self.fruit_color = (255, 200, 100)  # Orange for Zoan
-            elif fruit_type == "paramecia":
-                self.fruit_color = (150, 100, 255)  # Purple for Paramecia
+            self.fruit_color = self.FRUIT_COLORS.get(
+                character.devil_fruit.fruit_type,
+                self.base_color
+            )
         else:
             self.fruit_color = None
+        
+        self._build_fruit_indicator()
+    
+    def _build_fruit_indicator(self):
+        """Pre-render the Devil Fruit icon and name for the current character."""
+        self._fruit_icon_surface = None
+        self._fruit_name_surface = None
+        
+        if not self.character or not self.character.devil_fruit:
+            return
+        
+        fruit = self.character.devil_fruit
+        radius = self.fruit_icon_radius
+        center = (radius + 1, radius + 1)
+        
+        # Fruit icon (small circle with type indicator)
+        icon = pygame.Surface((center[0] * 2, center[1] * 2), pygame.SRCALPHA)
+        pygame.draw.circle(icon, self.fruit_color, center, radius)
+        pygame.draw.circle(icon, WHITE, center, radius, 2)
+        
+        # Type letter (P/Z/L)
+        type_letter = fruit.fruit_type[0].upper()
+        letter_text = self.letter_font.render(type_letter, True, WHITE)
+        icon.blit(letter_text, letter_text.get_rect(center=center))
+        self._fruit_icon_surface = icon
+        
+        # Fruit name below preview
+        fruit_name = fruit.name
+        if len(fruit_name) > 20:
+            fruit_name = fruit_name[:17] + "..."
+        
+        self._fruit_name_surface = self.fruit_font.render(
+            fruit_name,
+            True,
+            self.fruit_color
+        )
     
     def update(self, dt: float):
         """
@@ -77,7 +150,7 @@ class CharacterPreview:
         """
         # Simple bobbing animation
         self.bob_offset = self.bob_amplitude * math.sin(
-            pygame.time.get_ticks() * 0.001 * self.bob_speed
+            pygame.time.get_ticks() * self._bob_freq
         )
     
     def render(self, screen: pygame.Surface):
@@ -118,7 +191,7 @@ class CharacterPreview:
         pygame.draw.rect(screen, WHITE, placeholder_rect, 2)
         
         # Draw question mark
-        font = pygame.font.Font(None, 72)
+        font = get_font(72)
         text = font.render("?", True, WHITE)
         text_rect = text.get_rect(center=(self.x, self.y))
         screen.blit(text, text_rect)
@@ -151,22 +224,13 @@ class CharacterPreview:
         pygame.draw.circle(screen, BLACK, (x + eye_offset, y - eye_offset), eye_size // 2)
         
         # Smile
-        smile_rect = pygame.Rect(
-            x - self.size // 3,
-            y,
-            self.size // 1.5,
-            self.size // 3
-        )
-        pygame.draw.arc(screen, WHITE, smile_rect, 3.14, 0, 3)
+        screen.blit(self._smile_surface, (x - self.size // 3, y))
         
-        # Pirate hat (simple triangle)
-        hat_points = [
-            (x, y - self.size // 2 - 20),
-            (x - self.size // 3, y - self.size // 2),
-            (x + self.size // 3, y - self.size // 2)
-        ]
-        pygame.draw.polygon(screen, BLACK, hat_points)
-        pygame.draw.polygon(screen, WHITE, hat_points, 2)
+        # Pirate hat
+        screen.blit(
+            self._hat_surface,
+            (x - self.size // 3 - 1, y - self.size // 2 - 21)
+        )
     
     def _render_name(self, screen: pygame.Surface):
         """Render character name below the sprite."""
@@ -189,39 +253,22 @@ class CharacterPreview:
     
     def _render_fruit_indicator(self, screen: pygame.Surface):
         """Render Devil Fruit indicator."""
-        if not self.character or not self.character.devil_fruit:
+        if not self._fruit_icon_surface:
             return
         
-        fruit = self.character.devil_fruit
-        
-        # Fruit icon (small circle with type indicator)
-        icon_x = self.x - self.size // 2 - 20
-        icon_y = self.y - self.size // 2
-        icon_radius = 15
-        
-        # Draw fruit icon
-        pygame.draw.circle(screen, self.fruit_color, (icon_x, icon_y), icon_radius)
-        pygame.draw.circle(screen, WHITE, (icon_x, icon_y), icon_radius, 2)
-        
-        # Type letter (P/Z/L)
-        type_letter = fruit.fruit_type[0].upper()
-        letter_font = pygame.font.Font(None, 20)
-        letter_text = letter_font.render(type_letter, True, WHITE)
-        letter_rect = letter_text.get_rect(center=(icon_x, icon_y))
-        screen.blit(letter_text, letter_rect)
+        # Fruit icon
+        icon_center = (self.x - self.size // 2 - 20, self.y - self.size // 2)
+        screen.blit(
+            self._fruit_icon_surface,
+            self._fruit_icon_surface.get_rect(center=icon_center)
+        )
         
         # Fruit name below preview
-        fruit_name = fruit.name
-        if len(fruit_name) > 20:
-            fruit_name = fruit_name[:17] + "..."
-        
-        fruit_text = self.fruit_font.render(
-            fruit_name,
-            True,
-            self.fruit_color
+        name_center = (self.x, self.y + self.size // 2 + 70)
+        screen.blit(
+            self._fruit_name_surface,
+            self._fruit_name_surface.get_rect(center=name_center)
         )
-        fruit_rect = fruit_text.get_rect(center=(self.x, self.y + self.size // 2 + 70))
-        screen.blit(fruit_text, fruit_rect)
     
     def get_rect(self) -> pygame.Rect:
         """
@@ -10,15 +10,43 @@ from systems.equipment_manager import EquipmentSlots
 from systems.item_system import Inventory
 from ui.panel import Panel
 from ui.button import Button
+from ui.item_icons import get_item_icon
 from utils.constants import *
+from utils.resource_loader import get_font
 
 if TYPE_CHECKING:
     from entities.character import Character
 
 
+def _weapon_lines(weapon: Weapon) -> List[str]:
+    """Build the weapon-specific tooltip lines."""
+    lines = [
+        f"Attack: {weapon.attack_power}",
+        f"Speed: {weapon.attack_speed:.1f}x"
+    ]
+    if weapon.crit_bonus > 0:
+        lines.append(f"Crit: +{weapon.crit_bonus}%")
+    return lines
+
+
+def _armor_lines(armor: Armor) -> List[str]:
+    """Build the armor-specific tooltip lines."""
+    lines = [f"Defense: {armor.defense}"]
+    if armor.evasion_penalty != 0:
+        lines.append(f"Evasion: {armor.evasion_penalty:+d}")
+    return lines
+
+
 class EquipmentSlotUI:
     """Visual representation of an equipment slot."""
 
+    # Glyph drawn over the icon for each equipment class
+    TYPE_INDICATORS = {
+        Weapon: "⚔",
+        Armor: "🛡",
+        Accessory: "💍"
+    }
+
     def __init__(self, x: int, y: int, slot_type: str, size: int = 80):
         """
         Initialize equipment slot UI.
@@ -43,13 +71,29 @@ class EquipmentSlotUI:
         self.empty_color = (60, 60, 70)
 
         # Fonts
-        self.label_font = pygame.font.Font(None, 18)
-        self.name_font = pygame.font.Font(None, 20)
+        self.label_font = get_font(18)
+        self.name_font = get_font(20)
+
+        # Type indicator, resolved once per set_equipment
+        self._type_indicator = ""
+        self._type_surface: Optional[pygame.Surface] = None
 
     def set_equipment(self, equipment: Optional[Equipment]):
         """Set the equipment to display."""
         self.equipment = equipment
 
+        self._type_indicator = ""
+        if equipment is not None:
+            for equipment_class, indicator in self.TYPE_INDICATORS.items():
+                if isinstance(equipment, equipment_class):
+                    self._type_indicator = indicator
+                    break
+
+        if self._type_indicator:
+            self._type_surface = self.name_font.render(self._type_indicator, True, WHITE)
+        else:
+            self._type_surface = None
+
     def set_selected(self, selected: bool):
         """Set selection state."""
         self.is_selected = selected
@@ -91,20 +135,12 @@ class EquipmentSlotUI:
                 icon_size,
                 icon_size
             )
-            equipment_color = self.equipment.get_color()
-            pygame.draw.rect(surface, equipment_color, icon_rect)
+            atlas, area = get_item_icon(self.equipment, icon_size)
+            surface.blit(atlas, icon_rect, area)
 
             # Equipment type indicator
-            type_indicator = ""
-            if isinstance(self.equipment, Weapon):
-                type_indicator = "⚔"
-            elif isinstance(self.equipment, Armor):
-                type_indicator = "🛡"
-            elif isinstance(self.equipment, Accessory):
-                type_indicator = "💍"
-
-            if type_indicator:
-                type_surface = self.name_font.render(type_indicator, True, WHITE)
+            type_surface = self._type_surface
+            if type_surface:
                 type_x = icon_rect.centerx - type_surface.get_width() // 2
                 type_y = icon_rect.centery - type_surface.get_height() // 2
                 surface.blit(type_surface, (type_x, type_y))
@@ -125,16 +161,23 @@ class EquipmentSlotUI:
 class EquipmentTooltip:
     """Tooltip showing equipment details and stat bonuses."""
 
+    # Builders for the equipment-specific stat lines, keyed by class
+    SPECIFIC_LINE_BUILDERS = {
+        Weapon: _weapon_lines,
+        Armor: _armor_lines
+    }
+
     def __init__(self):
         """Initialize tooltip."""
         self.equipment: Optional[Equipment] = None
         self.visible = False
         self.position = (0, 0)
+        self._specific_lines: List[str] = []
 
         # Fonts
-        self.title_font = pygame.font.Font(None, 24)
-        self.text_font = pygame.font.Font(None, 20)
-        self.small_font = pygame.font.Font(None, 18)
+        self.title_font = get_font(24)
+        self.text_font = get_font(20)
+        self.small_font = get_font(18)
 
         # Colors
         self.bg_color = (20, 20, 30, 240)
@@ -145,6 +188,13 @@ class EquipmentTooltip:
         self.equipment = equipment
         self.visible = equipment is not None
 
+        self._specific_lines = []
+        if equipment is not None:
+            for equipment_class, builder in self.SPECIFIC_LINE_BUILDERS.items():
+                if isinstance(equipment, equipment_class):
+                    self._specific_lines = builder(equipment)
+                    break
+
     def set_position(self, x: int, y: int):
         """Set tooltip position."""
         self.position = (x, y)
@@ -153,6 +203,7 @@ class EquipmentTooltip:
         """Hide tooltip."""
         self.visible = False
         self.equipment = None
+        self._specific_lines = []
 
     def render(self, surface: pygame.Surface):
         """Render tooltip."""
@@ -171,16 +222,7 @@ class EquipmentTooltip:
                 stat_lines.append(f"  +{bonus} {stat.capitalize()}")
 
         # Equipment-specific stats
-        specific_lines = []
-        if isinstance(self.equipment, Weapon):
-            specific_lines.append(f"Attack: {self.equipment.attack_power}")
-            specific_lines.append(f"Speed: {self.equipment.attack_speed:.1f}x")
-            if self.equipment.crit_bonus > 0:
-                specific_lines.append(f"Crit: +{self.equipment.crit_bonus}%")
-        elif isinstance(self.equipment, Armor):
-            specific_lines.append(f"Defense: {self.equipment.defense}")
-            if self.equipment.evasion_penalty != 0:
-                specific_lines.append(f"Evasion: {self.equipment.evasion_penalty:+d}")
+        specific_lines = self._specific_lines
 
         # Level requirement
         level_line = f"Requires Level {self.equipment.level_requirement}"
@@ -256,6 +298,10 @@ class EquipmentMenu:
     """
     Equipment management menu.
     Shows character's current equipment and allows equipping/unequipping.
+
+    render() returns immediately while hidden, but callers should still
+    gate it on ``visible`` so no work is done at all during normal
+    gameplay.
     """
 
     def __init__(self, screen_width: int, screen_height: int):
@@ -301,9 +347,9 @@ class EquipmentMenu:
         self.on_close: Optional[Callable] = None
 
         # Fonts
-        self.title_font = pygame.font.Font(None, 36)
-        self.info_font = pygame.font.Font(None, 22)
-        self.stat_font = pygame.font.Font(None, 20)
+        self.title_font = get_font(36)
+        self.info_font = get_font(22)
+        self.stat_font = get_font(20)
 
     def _create_equipment_slots(self):
         """Create equipment slot UIs."""
@@ -323,6 +369,11 @@ class EquipmentMenu:
         accessory_slot = EquipmentSlotUI(start_x + 300, start_y, "accessory", slot_size)
         self.equipment_slots.append(accessory_slot)
 
+        # Slot rects for hit testing, plus their bounding box for
+        # rejecting hover checks early
+        self._slot_rects = [slot.rect for slot in self.equipment_slots]
+        self.slots_rect = weapon_slot.rect.unionall(self._slot_rects)
+
     def _create_buttons(self):
         """Create menu buttons."""
         button_y = self.panel_y + self.panel_height - 60
@@ -403,6 +454,10 @@ class EquipmentMenu:
         if event.type == pygame.MOUSEBUTTONDOWN:
             mouse_x, mouse_y = event.pos
 
+            # Nothing clickable outside the panel
+            if not self.panel.rect.collidepoint(mouse_x, mouse_y):
+                return
+
             # Check buttons
             if self.close_button.contains_point(mouse_x, mouse_y):
                 self.hide()
@@ -420,20 +475,17 @@ class EquipmentMenu:
                 return
 
             # Check equipment slots
-            for slot in self.equipment_slots:
-                if slot.contains_point(mouse_x, mouse_y):
-                    self._select_slot(slot)
-                    break
+            slot = self._slot_at(mouse_x, mouse_y)
+            if slot:
+                self._select_slot(slot)
 
         elif event.type == pygame.MOUSEMOTION:
             mouse_x, mouse_y = event.pos
 
             # Update hover state
             new_hovered = None
-            for slot in self.equipment_slots:
-                if slot.contains_point(mouse_x, mouse_y):
-                    new_hovered = slot
-                    break
+            if self.slots_rect.collidepoint(mouse_x, mouse_y):
+                new_hovered = self._slot_at(mouse_x, mouse_y)
 
             # Update hover
             if self.hovered_slot != new_hovered:
@@ -459,6 +511,23 @@ class EquipmentMenu:
                 if self.on_close:
                     self.on_close()
 
+    def _slot_at(self, x: int, y: int) -> Optional[EquipmentSlotUI]:
+        """
+        Find the slot under a point.
+
+        The slot rects are tested in one Rect.collidelist call (a C loop)
+        rather than a Python loop over the slots.
+
+        Args:
+            x: X position
+            y: Y position
+
+        Returns:
+            Slot at the point, or None
+        """
+        index = pygame.Rect(x, y, 1, 1).collidelist(self._slot_rects)
+        return self.equipment_slots[index] if index != -1 else None
+
     def _select_slot(self, slot: EquipmentSlotUI):
         """Select an equipment slot."""
         # Deselect previous
@@ -4,20 +4,63 @@ Visual inventory management with grid display and item tooltips.
 """
 
 import pygame
-from typing import Optional, Callable, List, TYPE_CHECKING
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Callable, Dict, List, Tuple, TYPE_CHECKING
 from systems.item_system import Item, Inventory, InventorySlot, Equipment
 from systems.item_loader import get_item_loader
 from ui.panel import Panel
 from ui.button import Button
+from ui.item_icons import get_item_icon, prefetch_icons
 from utils.constants import *
+from utils.resource_loader import get_font
+from utils.helpers import to_display_format
 
 if TYPE_CHECKING:
     from entities.character import Character
 
 
+@lru_cache(maxsize=512)
+def _wrap_text(text: str, max_chars: int) -> Tuple[str, ...]:
+    """
+    Wrap text to max characters per line.
+
+    Item descriptions are static, so results are memoized.
+
+    Args:
+        text: Text to wrap
+        max_chars: Maximum characters per line
+
+    Returns:
+        Wrapped lines
+    """
+    words = text.split()
+    lines = []
+    current_line = []
+    current_length = 0
+
+    for word in words:
+        if current_length + len(word) + 1 <= max_chars:
+            current_line.append(word)
+            current_length += len(word) + 1
+        else:
+            if current_line:
+                lines.append(" ".join(current_line))
+            current_line = [word]
+            current_length = len(word)
+
+    if current_line:
+        lines.append(" ".join(current_line))
+
+    return tuple(lines) or ("",)
+
+
 class ItemSlotUI:
     """Visual representation of a single inventory slot."""
 
+    # Rendered (text, shadow) surfaces per stack quantity, shared by all slots
+    _quantity_surfaces: Dict[int, Tuple[pygame.Surface, pygame.Surface]] = {}
+
     def __init__(self, x: int, y: int, size: int = 50):
         """
         Initialize item slot UI.
@@ -38,8 +81,8 @@ class ItemSlotUI:
         self.selected_color = UI_HIGHLIGHT_COLOR
         self.hover_color = LIGHT_GRAY
 
-        # Font
-        self.font = pygame.font.Font(None, 18)
+        # Font (shared, so quantity surfaces can be shared too)
+        self.font = get_font(18)
 
     def set_slot(self, slot: Optional[InventorySlot]):
         """Set the inventory slot to display."""
@@ -57,8 +100,32 @@ class ItemSlotUI:
         """Check if point is within slot."""
         return self.rect.collidepoint(x, y)
 
+    def get_icon_blit(self) -> Optional[Tuple[pygame.Surface, Tuple[int, int], pygame.Rect]]:
+        """
+        Get the (atlas, position, area) blit arguments for this slot's item.
+
+        Returns:
+            Blit arguments, or None if the slot is empty
+        """
+        if not self.slot or not self.slot.item:
+            return None
+
+        atlas, area = get_item_icon(self.slot.item, self.rect.width - 6)
+        return atlas, (self.rect.x + 3, self.rect.y + 3), area
+
     def render(self, surface: pygame.Surface):
         """Render the slot."""
+        self.render_background(surface)
+
+        icon_blit = self.get_icon_blit()
+        if icon_blit:
+            surface.blit(*icon_blit)
+
+        self.render_quantity(surface)
+        self.render_border(surface)
+
+    def render_background(self, surface: pygame.Surface):
+        """Render the slot background (drawn below the icon)."""
         # Determine background color
         if self.is_selected:
             bg = self.selected_color
@@ -67,35 +134,49 @@ class ItemSlotUI:
         else:
             bg = self.bg_color
 
-        # Draw background
         pygame.draw.rect(surface, bg, self.rect)
 
-        # Draw item if present
-        if self.slot and self.slot.item:
-            # Item icon placeholder (colored square based on rarity)
-            icon_size = self.rect.width - 6
-            icon_rect = pygame.Rect(
-                self.rect.x + 3,
-                self.rect.y + 3,
-                icon_size,
-                icon_size
-            )
-            item_color = self.slot.item.get_color()
-            pygame.draw.rect(surface, item_color, icon_rect)
-
-            # Quantity if stackable
-            if self.slot.item.stackable and self.slot.quantity > 1:
-                qty_text = self.font.render(str(self.slot.quantity), True, WHITE)
-                qty_x = self.rect.right - qty_text.get_width() - 2
-                qty_y = self.rect.bottom - qty_text.get_height() - 2
+    def get_quantity_blits(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """
+        Get the (surface, position) pairs for the stack quantity.
 
-                # Draw shadow
-                shadow = self.font.render(str(self.slot.quantity), True, BLACK)
-                surface.blit(shadow, (qty_x + 1, qty_y + 1))
-                # Draw text
-                surface.blit(qty_text, (qty_x, qty_y))
+        Returns:
+            Shadow then text blit pairs, or an empty list if nothing is shown
+        """
+        if not self.slot or not self.slot.item:
+            return []
+
+        # Quantity if stackable
+        if not self.slot.item.stackable or self.slot.quantity <= 1:
+            return []
+
+        qty_text, shadow = self._get_quantity_surfaces(self.slot.quantity)
+        qty_x = self.rect.right - qty_text.get_width() - 2
+        qty_y = self.rect.bottom - qty_text.get_height() - 2
+
+        return [
+            (shadow, (qty_x + 1, qty_y + 1)),
+            (qty_text, (qty_x, qty_y))
+        ]
+
+    def render_quantity(self, surface: pygame.Surface):
+        """Render the stack quantity (drawn above the icon)."""
+        surface.blits(self.get_quantity_blits(), doreturn=False)
+
+    def _get_quantity_surfaces(self, quantity: int) -> Tuple[pygame.Surface, pygame.Surface]:
+        """Get the (text, shadow) surfaces for a quantity, rendering on first use."""
+        surfaces = self._quantity_surfaces.get(quantity)
+        if surfaces is None:
+            text = str(quantity)
+            surfaces = (
+                self.font.render(text, True, WHITE),
+                self.font.render(text, True, BLACK)
+            )
+            self._quantity_surfaces[quantity] = surfaces
+        return surfaces
 
-        # Draw border
+    def render_border(self, surface: pygame.Surface):
+        """Render the slot border."""
         border_width = 2 if self.is_selected else 1
         pygame.draw.rect(surface, self.border_color, self.rect, border_width)
 
@@ -103,6 +184,23 @@ class ItemSlotUI:
 class ItemTooltip:
     """Tooltip showing item details."""
 
+    # Number of composited tooltips kept around
+    CACHE_SIZE = 64
+
+    # Number of items whose text lines are kept around (more than a full
+    # inventory, so prefetching one doesn't evict its own lines)
+    LINE_CACHE_SIZE = 128
+
+    # Layout constants
+    WIDTH = 300
+    LINE_HEIGHT = 22
+    PADDING = 10
+
+    # Rendered text lines per item id as ([(surface, offset), ...], height),
+    # least recently used first, shared by every tooltip since they all
+    # use the same fonts
+    _line_cache: 'OrderedDict[str, Tuple[List[Tuple[pygame.Surface, Tuple[int, int]]], int]]' = OrderedDict()
+
     def __init__(self):
         """Initialize tooltip."""
         self.item: Optional[Item] = None
@@ -110,15 +208,28 @@ class ItemTooltip:
         self.visible = False
         self.position = (0, 0)
 
-        # Fonts
-        self.title_font = pygame.font.Font(None, 24)
-        self.text_font = pygame.font.Font(None, 20)
-        self.small_font = pygame.font.Font(None, 18)
+        # Composited tooltip surfaces by item id, least recently used first
+        self._surface_cache: 'OrderedDict[str, pygame.Surface]' = OrderedDict()
+
+        # Fonts (shared, see _line_cache)
+        self.title_font = get_font(24)
+        self.text_font = get_font(20)
+        self.small_font = get_font(18)
 
         # Colors
         self.bg_color = (20, 20, 30, 240)  # Semi-transparent dark
         self.border_color = WHITE
 
+    def prefetch(self, items: List[Item]):
+        """
+        Render tooltip text for items ahead of time.
+
+        Args:
+            items: Items whose tooltips may be shown soon
+        """
+        for item in items:
+            self._get_item_lines(item)
+
     def set_item(self, item: Optional[Item], quantity: int = 1):
         """Set item to display."""
         self.item = item
@@ -139,107 +250,136 @@ class ItemTooltip:
         if not self.visible or not self.item:
             return
 
-        # Build tooltip content
-        lines = []
+        tooltip_surface = self._get_tooltip_surface()
+        width, height = tooltip_surface.get_size()
+
+        # Position (ensure it stays on screen)
+        x, y = self.position
+        if x + width > SCREEN_WIDTH:
+            x = SCREEN_WIDTH - width - 10
+        if y + height > SCREEN_HEIGHT:
+            y = SCREEN_HEIGHT - height - 10
+
+        # Skip entirely if nothing would land inside the visible area
+        if not surface.get_clip().colliderect((x, y, width, height)):
+            return
+
+        surface.blit(tooltip_surface, (x, y))
+
+    def _get_tooltip_surface(self) -> pygame.Surface:
+        """Get the composited tooltip for the current item, building it on a miss."""
+        key = self.item.id
+
+        tooltip_surface = self._surface_cache.get(key)
+        if tooltip_surface is not None:
+            self._surface_cache.move_to_end(key)
+            return tooltip_surface
+
+        tooltip_surface = self._build_tooltip_surface(self.item)
+        self._surface_cache[key] = tooltip_surface
+        if len(self._surface_cache) > self.CACHE_SIZE:
+            self._surface_cache.popitem(last=False)
+
+        return tooltip_surface
+
+    def _build_tooltip_surface(self, item: Item) -> pygame.Surface:
+        """
+        Composite the full tooltip for an item.
+
+        Args:
+            item: Item to describe
+
+        Returns:
+            Tooltip surface with background, border and text
+        """
+        lines, height = self._get_item_lines(item)
+
+        # Draw background
+        tooltip_surface = pygame.Surface((self.WIDTH, height), pygame.SRCALPHA)
+        tooltip_surface.fill(self.bg_color)
+
+        # Draw border
+        pygame.draw.rect(tooltip_surface, self.border_color, (0, 0, self.WIDTH, height), 2)
+
+        # Draw content in one batched call
+        tooltip_surface.blits(lines, doreturn=False)
+
+        return to_display_format(tooltip_surface, alpha=True)
+
+    def _get_item_lines(self, item: Item) -> Tuple[List[Tuple[pygame.Surface, Tuple[int, int]]], int]:
+        """
+        Get the rendered text lines for an item, rendering them on first use.
+
+        Args:
+            item: Item to describe
+
+        Returns:
+            ([(line surface, offset within tooltip), ...], tooltip height)
+        """
+        cached = self._line_cache.get(item.id)
+        if cached is not None:
+            self._line_cache.move_to_end(item.id)
+            return cached
+
+        line_height = self.LINE_HEIGHT
+        padding = self.PADDING
 
         # Title (item name with rarity color)
-        title_color = self.item.get_color()
+        title_color = item.get_color()
 
         # Description
-        desc_lines = self._wrap_text(self.item.description, 40)
+        desc_lines = _wrap_text(item.description, 40)
 
         # Stats for equipment
         stat_lines = []
-        if isinstance(self.item, Equipment):
-            if self.item.stat_bonuses:
+        if isinstance(item, Equipment):
+            if item.stat_bonuses:
                 stat_lines.append("Stats:")
-                for stat, bonus in self.item.stat_bonuses.items():
+                for stat, bonus in item.stat_bonuses.items():
                     stat_lines.append(f"  +{bonus} {stat.capitalize()}")
 
-            if self.item.level_requirement > 1:
-                stat_lines.append(f"Level Required: {self.item.level_requirement}")
+            if item.level_requirement > 1:
+                stat_lines.append(f"Level Required: {item.level_requirement}")
 
         # Value
-        value_line = f"Value: {self.item.value} Berries"
+        value_line = f"Value: {item.value} Berries"
 
         # Calculate tooltip size
-        width = 300
-        line_height = 22
-        padding = 10
-
         total_lines = 1 + len(desc_lines) + len(stat_lines) + 2  # Title + desc + stats + value + type
         height = padding * 2 + (total_lines * line_height)
 
-        # Position (ensure it stays on screen)
-        x, y = self.position
-        if x + width > SCREEN_WIDTH:
-            x = SCREEN_WIDTH - width - 10
-        if y + height > SCREEN_HEIGHT:
-            y = SCREEN_HEIGHT - height - 10
-
-        # Draw background
-        tooltip_surface = pygame.Surface((width, height))
-        tooltip_surface.set_alpha(240)
-        tooltip_surface.fill((20, 20, 30))
-        surface.blit(tooltip_surface, (x, y))
-
-        # Draw border
-        pygame.draw.rect(surface, self.border_color, (x, y, width, height), 2)
-
-        # Draw content
-        current_y = y + padding
+        lines = []
+        current_y = padding
 
         # Title
-        title_text = self.title_font.render(self.item.name, True, title_color)
-        surface.blit(title_text, (x + padding, current_y))
+        lines.append((self.title_font.render(item.name, True, title_color), (padding, current_y)))
         current_y += line_height + 5
 
         # Type and rarity
-        type_text = f"{self.item.item_type.value.capitalize()} - {self.item.rarity.value.capitalize()}"
-        type_surface = self.small_font.render(type_text, True, LIGHT_GRAY)
-        surface.blit(type_surface, (x + padding, current_y))
+        type_text = f"{item.item_type.value.capitalize()} - {item.rarity.value.capitalize()}"
+        lines.append((self.small_font.render(type_text, True, LIGHT_GRAY), (padding, current_y)))
         current_y += line_height
 
         # Description
         for line in desc_lines:
-            desc_surface = self.text_font.render(line, True, WHITE)
-            surface.blit(desc_surface, (x + padding, current_y))
+            lines.append((self.text_font.render(line, True, WHITE), (padding, current_y)))
             current_y += line_height
 
         # Stats
         if stat_lines:
             current_y += 5
             for line in stat_lines:
-                stat_surface = self.text_font.render(line, True, GREEN)
-                surface.blit(stat_surface, (x + padding, current_y))
+                lines.append((self.text_font.render(line, True, GREEN), (padding, current_y)))
                 current_y += line_height
 
         # Value
         current_y += 5
-        value_surface = self.text_font.render(value_line, True, YELLOW)
-        surface.blit(value_surface, (x + padding, current_y))
+        lines.append((self.text_font.render(value_line, True, YELLOW), (padding, current_y)))
 
-    def _wrap_text(self, text: str, max_chars: int) -> List[str]:
-        """Wrap text to max characters per line."""
-        words = text.split()
-        lines = []
-        current_line = []
-        current_length = 0
-
-        for word in words:
-            if current_length + len(word) + 1 <= max_chars:
-                current_line.append(word)
-                current_length += len(word) + 1
-            else:
-                if current_line:
-                    lines.append(" ".join(current_line))
-                current_line = [word]
-                current_length = len(word)
-
-        if current_line:
-            lines.append(" ".join(current_line))
-
-        return lines or [""]
+        self._line_cache[item.id] = (lines, height)
+        if len(self._line_cache) > self.LINE_CACHE_SIZE:
+            self._line_cache.popitem(last=False)
+        return lines, height
 
 
 class InventoryMenu:
@@ -277,10 +417,25 @@ class InventoryMenu:
         # Background panel
         self.panel = Panel(self.panel_x, self.panel_y, self.panel_width, self.panel_height)
 
+        # Semi-transparent overlay behind the panel
+        self._overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+        self._overlay.fill((0, 0, 0, 200))
+        self._overlay = to_display_format(self._overlay, alpha=True)
+
+        # Snapshot of the rendered panel, reused until something changes
+        self._menu_snapshot = to_display_format(pygame.Surface(self.panel.rect.size))
+        self._dirty = True
+
         # Item slots
         self.item_slots: List[ItemSlotUI] = []
         self._create_slot_grid()
 
+        # Icons for all filled slots, drawn from the icon atlas with one blits() call
+        self._icon_blit_seq: List[Tuple[pygame.Surface, Tuple[int, int], pygame.Rect]] = []
+
+        # Quantity text and shadows for all stacked slots, drawn the same way
+        self._quantity_blit_seq: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+
         # Selection
         self.selected_slot: Optional[ItemSlotUI] = None
         self.hovered_slot: Optional[ItemSlotUI] = None
@@ -296,8 +451,13 @@ class InventoryMenu:
         self.on_use_item: Optional[Callable] = None
 
         # Fonts
-        self.title_font = pygame.font.Font(None, 36)
-        self.info_font = pygame.font.Font(None, 22)
+        self.title_font = get_font(36)
+        self.info_font = get_font(22)
+
+        # Static title, and the item count line keyed by its text
+        self._title_surface = self.title_font.render("Inventory", True, WHITE)
+        self._info_text = ""
+        self._info_surface: Optional[pygame.Surface] = None
 
     def _create_slot_grid(self):
         """Create grid of item slots."""
@@ -312,6 +472,23 @@ class InventoryMenu:
                 slot = ItemSlotUI(x, y, self.SLOT_SIZE)
                 self.item_slots.append(slot)
 
+        self._build_grid_background()
+
+    def _build_grid_background(self):
+        """Pre-render the idle background and border of every slot."""
+        grid_rect = self.item_slots[0].rect.unionall(
+            [slot.rect for slot in self.item_slots]
+        )
+        self._grid_origin = grid_rect.topleft
+
+        self._grid_bg = pygame.Surface(grid_rect.size, pygame.SRCALPHA)
+        for slot in self.item_slots:
+            local_rect = slot.rect.move(-grid_rect.x, -grid_rect.y)
+            pygame.draw.rect(self._grid_bg, slot.bg_color, local_rect)
+            pygame.draw.rect(self._grid_bg, slot.border_color, local_rect, 1)
+
+        self._grid_bg = to_display_format(self._grid_bg, alpha=True)
+
     def _create_buttons(self):
         """Create menu buttons."""
         button_y = self.panel_y + self.panel_height - 60
@@ -356,6 +533,12 @@ class InventoryMenu:
         """
         self.inventory = inventory
         self.character = character
+
+        # Warm icon and tooltip caches while the scene is loading
+        items = [slot.item for slot in inventory.get_all_items()]
+        prefetch_icons(items, self.SLOT_SIZE - 6)
+        self.tooltip.prefetch(items)
+
         self._update_slots()
 
     def _update_slots(self):
@@ -367,20 +550,30 @@ class InventoryMenu:
         inventory_items = self.inventory.get_all_items()
 
         # Update slots
+        self._dirty = True
+        self._icon_blit_seq = []
+        self._quantity_blit_seq = []
         for i, slot_ui in enumerate(self.item_slots):
             if i < len(inventory_items):
                 slot_ui.set_slot(inventory_items[i])
             else:
                 slot_ui.set_slot(None)
 
+            icon_blit = slot_ui.get_icon_blit()
+            if icon_blit:
+                self._icon_blit_seq.append(icon_blit)
+            self._quantity_blit_seq.extend(slot_ui.get_quantity_blits())
+
     def show(self):
         """Show the menu."""
         self.visible = True
+        self._dirty = True
         self._update_slots()
 
     def hide(self):
         """Hide the menu."""
         self.visible = False
+        self._dirty = True
         self.tooltip.hide()
         if self.selected_slot:
             self.selected_slot.set_selected(False)
@@ -423,20 +616,19 @@ class InventoryMenu:
                 return
 
             # Check item slots
-            for slot in self.item_slots:
-                if slot.contains_point(mouse_x, mouse_y) and slot.slot:
-                    self._select_slot(slot)
-                    break
+            slot = self._slot_at(mouse_x, mouse_y)
+            if slot and slot.slot:
+                self._select_slot(slot)
 
         elif event.type == pygame.MOUSEMOTION:
             mouse_x, mouse_y = event.pos
 
+            # Still inside the hovered slot, nothing to update
+            if self.hovered_slot and self.hovered_slot.contains_point(mouse_x, mouse_y):
+                return
+
             # Update hover state
-            new_hovered = None
-            for slot in self.item_slots:
-                if slot.contains_point(mouse_x, mouse_y):
-                    new_hovered = slot
-                    break
+            new_hovered = self._slot_at(mouse_x, mouse_y)
 
             # Update hover
             if self.hovered_slot != new_hovered:
@@ -444,6 +636,7 @@ class InventoryMenu:
                     self.hovered_slot.set_hovered(False)
 
                 self.hovered_slot = new_hovered
+                self._dirty = True
 
                 if self.hovered_slot:
                     self.hovered_slot.set_hovered(True)
@@ -462,8 +655,36 @@ class InventoryMenu:
                 if self.on_close:
                     self.on_close()
 
+    def _slot_at(self, x: int, y: int) -> Optional[ItemSlotUI]:
+        """
+        Find the slot under a point using grid arithmetic.
+
+        Args:
+            x: X position
+            y: Y position
+
+        Returns:
+            Slot at the point, or None if outside the grid or in a gap
+        """
+        stride = self.SLOT_SIZE + self.SLOT_SPACING
+        local_x = x - self._grid_origin[0]
+        local_y = y - self._grid_origin[1]
+        if local_x < 0 or local_y < 0:
+            return None
+
+        col, offset_x = divmod(local_x, stride)
+        row, offset_y = divmod(local_y, stride)
+        if col >= self.GRID_COLS or row >= self.GRID_ROWS:
+            return None
+        if offset_x >= self.SLOT_SIZE or offset_y >= self.SLOT_SIZE:
+            return None
+
+        return self.item_slots[row * self.GRID_COLS + col]
+
     def _select_slot(self, slot: ItemSlotUI):
         """Select a slot."""
+        self._dirty = True
+
         # Deselect previous
         if self.selected_slot:
             self.selected_slot.set_selected(False)
@@ -567,28 +788,57 @@ class InventoryMenu:
             return
 
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
+        surface.blit(self._overlay, (0, 0))
+
+        # Reuse the last rendered panel unless something changed. The panel
+        # is opaque and everything but the tooltip is drawn inside it.
+        if self._dirty:
+            self._render_menu(surface)
+            self._menu_snapshot.blit(surface, (0, 0), self.panel.rect)
+            self._dirty = False
+        else:
+            surface.blit(self._menu_snapshot, self.panel.rect)
+
+        # Draw tooltip (on top)
+        self.tooltip.render(surface)
 
+    def _render_menu(self, surface: pygame.Surface):
+        """
+        Render the panel and everything on it.
+
+        Args:
+            surface: Surface to draw on
+        """
         # Draw panel
         self.panel.render(surface)
 
         # Draw title
-        title_surface = self.title_font.render("Inventory", True, WHITE)
+        title_surface = self._title_surface
         title_x = self.panel_x + (self.panel_width - title_surface.get_width()) // 2
         surface.blit(title_surface, (title_x, self.panel_y + 15))
 
         # Draw inventory info
         if self.inventory:
             info_text = f"Items: {len(self.inventory.slots)}/{self.inventory.max_slots}"
-            info_surface = self.info_font.render(info_text, True, LIGHT_GRAY)
-            surface.blit(info_surface, (self.panel_x + 20, self.panel_y + 50))
+            if info_text != self._info_text:
+                self._info_text = info_text
+                self._info_surface = self.info_font.render(info_text, True, LIGHT_GRAY)
+            surface.blit(self._info_surface, (self.panel_x + 20, self.panel_y + 50))
 
-        # Draw item slots
-        for slot in self.item_slots:
-            slot.render(surface)
+        # Draw item slots: the pre-rendered idle grid, highlights for the
+        # selected/hovered slots, every icon in one batched blit, then
+        # quantities and highlight borders on top
+        surface.blit(self._grid_bg, self._grid_origin)
+
+        active_slots = [slot for slot in (self.hovered_slot, self.selected_slot) if slot]
+        for slot in active_slots:
+            slot.render_background(surface)
+
+        surface.blits(self._icon_blit_seq, doreturn=False)
+
+        surface.blits(self._quantity_blit_seq, doreturn=False)
+        for slot in active_slots:
+            slot.render_border(surface)
 
         # Draw buttons
         self.sort_button.render(surface)
@@ -596,9 +846,6 @@ class InventoryMenu:
         self.equip_button.render(surface)
         self.close_button.render(surface)
 
-        # Draw tooltip (on top)
-        self.tooltip.render(surface)
-
     def set_visible(self, visible: bool):
         """Set menu visibility."""
         if visible:
@@ -0,0 +1,104 @@
+"""
+Item Icons
+Shared icon surfaces for drawing items in menus.
+
+All icons of a given size are packed side by side into one atlas
+surface, so a whole inventory grid is drawn from a single source
+surface. Blit with ``surface.blit(atlas, dest, area=rect)``.
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
+from systems.item_system import Item, RARITY_COLORS
+from utils.helpers import to_display_format
+
+
+# Color used when an item reports a color outside RARITY_COLORS
+DEFAULT_ICON_COLOR = (255, 255, 255)
+
+# Number of icon sizes kept; the least recently used atlas is dropped
+MAX_ATLASES = 8
+
+# Atlas surface per icon size (least recently used first), and the
+# colors packed into each (in order)
+_atlases: 'OrderedDict[int, pygame.Surface]' = OrderedDict()
+_atlas_colors: Dict[int, List[Tuple[int, int, int]]] = {}
+
+# Source rect within the atlas, keyed by (color, size)
+_atlas_rects: Dict[Tuple[Tuple[int, int, int], int], pygame.Rect] = {}
+
+
+def _build_atlas(size: int, colors: List[Tuple[int, int, int]]):
+    """
+    Pack one icon per color into a single atlas surface.
+
+    Args:
+        size: Icon width and height in pixels
+        colors: Icon colors, packed left to right
+    """
+    atlas = pygame.Surface((size * len(colors), size))
+
+    for index, color in enumerate(colors):
+        rect = pygame.Rect(index * size, 0, size, size)
+        atlas.fill(color, rect)
+        _atlas_rects[(color, size)] = rect
+
+    _atlases[size] = to_display_format(atlas)
+    _atlases.move_to_end(size)
+    _atlas_colors[size] = colors
+
+    # Evict the least recently used size. Surfaces already handed out
+    # stay valid for as long as callers hold them.
+    if len(_atlases) > MAX_ATLASES:
+        evicted_size, _ = _atlases.popitem(last=False)
+        for evicted_color in _atlas_colors.pop(evicted_size):
+            del _atlas_rects[(evicted_color, evicted_size)]
+
+
+def get_item_icon(item: Item, size: int) -> Tuple[pygame.Surface, pygame.Rect]:
+    """
+    Get the icon for an item as an atlas region.
+
+    Items are drawn as squares tinted by rarity until real item art
+    exists. Every rarity color is packed up front; an unexpected color
+    grows the atlas once.
+
+    Args:
+        item: Item to get the icon for
+        size: Icon width and height in pixels
+
+    Returns:
+        (atlas, source_rect) tuple (the atlas is shared, do not draw on it)
+    """
+    color = item.get_color()
+    rect = _atlas_rects.get((color, size))
+
+    if rect is None:
+        colors = _atlas_colors.get(size)
+        if colors is None:
+            colors = list(RARITY_COLORS.values()) + [DEFAULT_ICON_COLOR]
+        if color not in colors:
+            colors = colors + [color]
+
+        _build_atlas(size, colors)
+        rect = _atlas_rects[(color, size)]
+    else:
+        _atlases.move_to_end(size)
+
+    return _atlases[size], rect
+
+
+def prefetch_icons(items: Iterable[Item], size: int):
+    """
+    Build the icons for a set of items ahead of time.
+
+    Call while a scene is loading so the first frame that shows these
+    items doesn't pay for building the atlas.
+
+    Args:
+        items: Items that are about to be displayed
+        size: Icon width and height in pixels
+    """
+    for item in items:
+        get_item_icon(item, size)
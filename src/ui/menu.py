@@ -3,8 +3,12 @@ Menu Component
 Generic menu system for creating navigable option lists.
 """
 
+import math
 import pygame
 from utils.constants import WHITE, UI_HIGHLIGHT_COLOR, GRAY
+from utils.resource_loader import get_font
+from utils.helpers import to_display_format
+from ui.text_cache import render_text
 
 
 class Menu:
@@ -25,7 +29,7 @@ class Menu:
         """
         self.x = x
         self.y = y
-        self.options = options
+        self.options = tuple(options)  # Frozen so the cached layout can't go stale
         self.spacing = spacing
         self.selected_index = 0
         
@@ -39,7 +43,8 @@ class Menu:
         self.disabled_color = GRAY
         
         # Font
-        self.font = pygame.font.Font(None, font_size)
+        self.font_size = font_size
+        self.font = get_font(font_size)
         
         # Selection indicator
         self.show_indicator = True
@@ -49,24 +54,47 @@ class Menu:
         self.pulse_timer = 0
         self.pulse_speed = 3.0
         
+        # Labels pre-drawn onto one surface, rebuilt when the options are
+        # rebuilt or the selection/colors it was drawn with change
+        self._composite = None
+        self._composite_pos = (0, 0)
+        self._composite_state = None
+        self._dirty = True
+        
+        # Event handlers by event type (subclasses override _on_key)
+        self._event_handlers = {
+            pygame.KEYDOWN: self._on_key,
+            pygame.MOUSEMOTION: self._on_motion,
+            pygame.MOUSEBUTTONDOWN: self._on_click,
+        }
+        
         # Build option rects for mouse interaction
         self._build_option_rects()
     
     def _build_option_rects(self):
-        """Create rectangles for each option for mouse detection."""
+        """Create rectangles for each option for mouse detection.
+        
+        Also lays out the label center for each option, so rendering
+        doesn't recompute them.
+        """
         self.option_rects = []
+        self._option_centers = []
         
         for i, option in enumerate(self.options):
             text = self.indicator_text + option if self.show_indicator else option
             text_surface = self.font.render(text, True, self.text_color)
             
-            y_pos = self.y + (i * self.spacing)
-            rect = text_surface.get_rect(center=(self.x, y_pos))
+            center = (self.x, self.y + (i * self.spacing))
+            rect = text_surface.get_rect(center=center)
             
             # Add some padding for easier clicking
             rect.inflate_ip(20, 10)
             
             self.option_rects.append(rect)
+            self._option_centers.append(center)
+        
+        # Rows only overlap if the spacing is tighter than the option rects
+        self._rows_overlap = any(rect.height > self.spacing for rect in self.option_rects)
     
     def handle_event(self, event):
         """
@@ -81,31 +109,56 @@ class Menu:
         if not self.visible or not self.enabled:
             return None
         
-        if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_UP, pygame.K_w):
-                self.move_selection(-1)
-            elif event.key in (pygame.K_DOWN, pygame.K_s):
-                self.move_selection(1)
-            elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                return self.selected_index
-        
-        elif event.type == pygame.MOUSEMOTION:
-            # Check which option is hovered
-            for i, rect in enumerate(self.option_rects):
-                if rect.collidepoint(event.pos):
-                    self.selected_index = i
-                    break
-        
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:  # Left click
-                # Check if clicked on an option
-                for i, rect in enumerate(self.option_rects):
-                    if rect.collidepoint(event.pos):
-                        self.selected_index = i
-                        return i
-        
+        handler = self._event_handlers.get(event.type)
+        return handler(event) if handler else None
+    
+    def _on_key(self, event):
+        """Move the selection with up/down, confirm with enter/space."""
+        if event.key in (pygame.K_UP, pygame.K_w):
+            self.move_selection(-1)
+        elif event.key in (pygame.K_DOWN, pygame.K_s):
+            self.move_selection(1)
+        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            return self.selected_index
+        return None
+    
+    def _on_motion(self, event):
+        """Select the hovered option."""
+        index = self._option_at(event.pos)
+        if index >= 0:
+            self.selected_index = index
+        return None
+    
+    def _on_click(self, event):
+        """Select and confirm the clicked option."""
+        if event.button == 1:  # Left click
+            index = self._option_at(event.pos)
+            if index >= 0:
+                self.selected_index = index
+                return index
         return None
     
+    def _option_at(self, pos):
+        """
+        Get the option under a screen position.
+        
+        Options are evenly spaced, so only the option whose row is
+        nearest the position needs a hit test (unless rows overlap).
+        
+        Args:
+            pos: (x, y) screen position
+            
+        Returns:
+            Option index, or -1 if no option is there
+        """
+        if self._rows_overlap:
+            return pygame.Rect(pos, (1, 1)).collidelist(self.option_rects)
+        
+        index = (pos[1] - self.y + self.spacing // 2) // self.spacing
+        if 0 <= index < len(self.option_rects) and self.option_rects[index].collidepoint(pos):
+            return index
+        return -1
+    
     def update(self, dt):
         """
         Update menu state.
@@ -129,30 +182,116 @@ class Menu:
         if not self.visible:
             return
         
-        for i, option in enumerate(self.options):
-            y_pos = self.y + (i * self.spacing)
-            
-            # Determine if this option is selected
-            is_selected = (i == self.selected_index)
-            
-            # Choose color
-            if not self.enabled:
-                color = self.disabled_color
-            elif is_selected:
-                # Pulse effect
-                pulse = abs(pygame.math.Vector2(1, 0).rotate(self.pulse_timer * 60).x)
-                alpha = int(155 + (pulse * 100))
-                color = self.selected_color
-            else:
-                color = self.text_color
-            
-            # Add indicator to selected option
-            text = self.indicator_text + option if (is_selected and self.show_indicator) else "  " + option
-            
-            # Render text
-            text_surface = self.font.render(text, True, color)
-            text_rect = text_surface.get_rect(center=(self.x, y_pos))
-            surface.blit(text_surface, text_rect)
+        surface.blits(self.get_blit_seq(), doreturn=False)
+    
+    def get_blit_seq(self):
+        """
+        Get the blits that draw the menu in its current state.
+        
+        Lets a parent panel batch this menu's blits with its other
+        children into a single surface.blits() call. While nothing
+        changes this is a single blit of the pre-drawn labels.
+        
+        Returns:
+            List of (surface, dest) pairs, empty if the menu is hidden
+        """
+        if not self.visible:
+            return []
+        
+        state = (self.selected_index, self.enabled, self.show_indicator, self.indicator_text,
+                 self.text_color, self.selected_color, self.disabled_color)
+        if self._dirty or state != self._composite_state:
+            self._build_composite()
+            self._composite_state = state
+            self._dirty = False
+        
+        if self._composite is None:
+            return []
+        return [(self._composite, self._composite_pos)]
+    
+    def _build_composite(self):
+        """Draw all option labels onto one transparent surface."""
+        label_blits = self._get_label_blits()
+        if not label_blits:
+            self._composite = None
+            return
+        
+        # Destinations are Rects or (x, y) pairs
+        label_rects = [label.get_rect(topleft=(dest[0], dest[1])) for label, dest in label_blits]
+        bounds = label_rects[0].unionall(label_rects)
+        composite = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        
+        # RGBA_MAX copies each label's pixels and alpha as-is onto the
+        # transparent surface (a normal blend would darken the edges)
+        composite.blits(
+            [(label, (dest[0] - bounds.x, dest[1] - bounds.y), None, pygame.BLEND_RGBA_MAX)
+             for label, dest in label_blits],
+            doreturn=False
+        )
+        
+        self._composite = to_display_format(composite, alpha=True)
+        self._composite_pos = bounds.topleft
+    
+    def _build_label_surfaces(self):
+        """
+        Render every option's label in each state it can be drawn in.
+        
+        Each list holds a (surface, rect) pair per option, so picking
+        labels for the current selection is plain indexing.
+        """
+        def labels(texts, color):
+            label_blits = []
+            for text, center in zip(texts, self._option_centers):
+                text_surface = render_text(text, self.font_size, color)
+                label_blits.append((text_surface, text_surface.get_rect(center=center)))
+            return label_blits
+        
+        selected_texts, unselected_texts = self._get_label_texts()
+        self._normal_labels = labels(unselected_texts, self.text_color)
+        self._selected_labels = labels(selected_texts, self.selected_color)
+        self._disabled_labels = labels(unselected_texts, self.disabled_color)
+        self._disabled_selected_labels = labels(selected_texts, self.disabled_color)
+        self._label_key = self._get_label_key()
+    
+    def _get_label_texts(self):
+        """
+        Get each option's label text for the current indicator settings.
+        
+        Returns:
+            (selected texts, unselected texts), one per option
+        """
+        unselected_texts = ["  " + option for option in self.options]
+        if not self.show_indicator:
+            return unselected_texts, unselected_texts
+        return [self.indicator_text + option for option in self.options], unselected_texts
+    
+    def _get_label_key(self):
+        """Get the settings the pre-rendered labels depend on."""
+        return (self.show_indicator, self.indicator_text,
+                self.text_color, self.selected_color, self.disabled_color)
+    
+    def _get_label_blits(self):
+        """
+        Get the label blits for the current selection, indicator and colors.
+        
+        Returns:
+            List of (surface, dest) pairs in screen coordinates
+        """
+        if self._dirty or self._get_label_key() != self._label_key:
+            self._build_label_surfaces()
+        
+        if self.enabled:
+            blit_seq = list(self._normal_labels)
+            selected_labels = self._selected_labels
+        else:
+            blit_seq = list(self._disabled_labels)
+            selected_labels = self._disabled_selected_labels
+        
+        # Selected option carries the indicator
+        if 0 <= self.selected_index < len(blit_seq):
+            blit_seq[self.selected_index] = selected_labels[self.selected_index]
+        
+        return blit_seq
     
     def move_selection(self, direction):
         """
@@ -178,9 +317,10 @@ class Menu:
     
     def set_options(self, options):
         """Change the menu options."""
-        self.options = options
+        self.options = tuple(options)
         self.selected_index = 0
         self._build_option_rects()
+        self._dirty = True
     
     def set_enabled(self, enabled):
         """Enable or disable the menu."""
@@ -207,84 +347,71 @@ class HorizontalMenu(Menu):
             font_size: Size of option text
             spacing: Horizontal spacing between options
         """
+        # Underline surfaces keyed by (width, color)
+        self._underline_surfaces = {}
+        
         super().__init__(x, y, options, font_size, spacing)
     
     def _build_option_rects(self):
-        """Build rects for horizontal layout."""
+        """Build rects and label centers for horizontal layout."""
         self.option_rects = []
+        self._option_centers = []
         
         for i, option in enumerate(self.options):
             text_surface = self.font.render(option, True, self.text_color)
             
-            x_pos = self.x + (i * self.spacing)
-            rect = text_surface.get_rect(center=(x_pos, self.y))
+            center = (self.x + (i * self.spacing), self.y)
+            rect = text_surface.get_rect(center=center)
             rect.inflate_ip(20, 10)
             
             self.option_rects.append(rect)
+            self._option_centers.append(center)
     
-    def handle_event(self, event):
-        """Handle input with left/right keys."""
-        if not self.visible or not self.enabled:
-            return None
-        
-        if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_LEFT, pygame.K_a):
-                self.move_selection(-1)
-            elif event.key in (pygame.K_RIGHT, pygame.K_d):
-                self.move_selection(1)
-            elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                return self.selected_index
-        
-        # Still handle mouse normally
-        elif event.type == pygame.MOUSEMOTION:
-            for i, rect in enumerate(self.option_rects):
-                if rect.collidepoint(event.pos):
-                    self.selected_index = i
-                    break
-        
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:
-                for i, rect in enumerate(self.option_rects):
-                    if rect.collidepoint(event.pos):
-                        self.selected_index = i
-                        return i
-        
+    def _get_label_texts(self):
+        """Labels are the same whether or not they are selected."""
+        return self.options, self.options
+    
+    def _on_key(self, event):
+        """Handle input with left/right keys (mouse is handled normally)."""
+        if event.key in (pygame.K_LEFT, pygame.K_a):
+            self.move_selection(-1)
+        elif event.key in (pygame.K_RIGHT, pygame.K_d):
+            self.move_selection(1)
+        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            return self.selected_index
         return None
     
-    def render(self, surface):
-        """Draw horizontal menu."""
-        if not self.visible:
-            return
+    def _option_at(self, pos):
+        """Get the option under a screen position.
         
-        for i, option in enumerate(self.options):
-            x_pos = self.x + (i * self.spacing)
-            
-            is_selected = (i == self.selected_index)
-            
-            # Choose color
-            if not self.enabled:
-                color = self.disabled_color
-            elif is_selected:
-                pulse = abs(pygame.math.Vector2(1, 0).rotate(self.pulse_timer * 60).x)
-                color = self.selected_color
-            else:
-                color = self.text_color
-            
-            # Render text
-            text_surface = self.font.render(option, True, color)
-            text_rect = text_surface.get_rect(center=(x_pos, self.y))
-            surface.blit(text_surface, text_rect)
-            
-            # Draw underline for selected
-            if is_selected and self.show_indicator:
-                underline_width = text_rect.width
-                underline_rect = pygame.Rect(
-                    text_rect.left,
-                    text_rect.bottom + 5,
-                    underline_width,
-                    3
-                )
-                pygame.draw.rect(surface, color, underline_rect)
+        Label widths vary and neighbouring rects can overlap, so this
+        keeps the first-match scan, done in one collidelist() call.
+        """
+        return pygame.Rect(pos, (1, 1)).collidelist(self.option_rects)
+    
+    def _get_label_blits(self):
+        """Get the label blits for the horizontal menu, underline included."""
+        blit_seq = super()._get_label_blits()
+        
+        # Draw underline for selected
+        if self.show_indicator and 0 <= self.selected_index < len(blit_seq):
+            color = self.selected_color if self.enabled else self.disabled_color
+            text_rect = blit_seq[self.selected_index][1]
+            underline = self._get_underline_surface(text_rect.width, color)
+            blit_seq.append((underline, (text_rect.left, text_rect.bottom + 5)))
+        
+        return blit_seq
+    
+    def _get_underline_surface(self, width, color):
+        """Get a filled 3px-high underline surface, creating it on first use."""
+        key = (width, color)
+        underline = self._underline_surfaces.get(key)
+        if underline is None:
+            underline = pygame.Surface((width, 3))
+            underline.fill(color)
+            underline = to_display_format(underline)
+            self._underline_surfaces[key] = underline
+        return underline
 
 
 class GridMenu(Menu):
@@ -310,19 +437,21 @@ class GridMenu(Menu):
         self.cell_width = cell_width
         self.cell_height = cell_height
         
+        # Selected cell background, refilled only if selected_color changes
+        self._selection_bg = to_display_format(pygame.Surface((cell_width, cell_height)))
+        self._selection_bg_color = None
+        
         super().__init__(x, y, options, font_size, cell_height)
     
     def _build_option_rects(self):
-        """Build rects for grid layout."""
+        """Build cell rects for grid layout (labels are centered in their cell)."""
         self.option_rects = []
+        self._option_centers = []
         
         for i, option in enumerate(self.options):
             row = i // self.columns
             col = i % self.columns
             
-            x_pos = self.x + (col * self.cell_width) + (self.cell_width // 2)
-            y_pos = self.y + (row * self.cell_height) + (self.cell_height // 2)
-            
             rect = pygame.Rect(
                 self.x + (col * self.cell_width),
                 self.y + (row * self.cell_height),
@@ -331,40 +460,36 @@ class GridMenu(Menu):
             )
             
             self.option_rects.append(rect)
+            self._option_centers.append(rect.center)
     
-    def handle_event(self, event):
+    def _get_label_texts(self):
+        """Labels are the same whether or not they are selected."""
+        return self.options, self.options
+    
+    def _on_key(self, event):
         """Handle input with arrow keys for grid navigation."""
-        if not self.visible or not self.enabled:
-            return None
-        
-        if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_UP, pygame.K_w):
-                self._move_selection_grid(-1, 0)
-            elif event.key in (pygame.K_DOWN, pygame.K_s):
-                self._move_selection_grid(1, 0)
-            elif event.key in (pygame.K_LEFT, pygame.K_a):
-                self._move_selection_grid(0, -1)
-            elif event.key in (pygame.K_RIGHT, pygame.K_d):
-                self._move_selection_grid(0, 1)
-            elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                return self.selected_index
-        
-        # Mouse handling
-        elif event.type == pygame.MOUSEMOTION:
-            for i, rect in enumerate(self.option_rects):
-                if rect.collidepoint(event.pos):
-                    self.selected_index = i
-                    break
-        
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:
-                for i, rect in enumerate(self.option_rects):
-                    if rect.collidepoint(event.pos):
-                        self.selected_index = i
-                        return i
-        
+        if event.key in (pygame.K_UP, pygame.K_w):
+            self._move_selection_grid(-1, 0)
+        elif event.key in (pygame.K_DOWN, pygame.K_s):
+            self._move_selection_grid(1, 0)
+        elif event.key in (pygame.K_LEFT, pygame.K_a):
+            self._move_selection_grid(0, -1)
+        elif event.key in (pygame.K_RIGHT, pygame.K_d):
+            self._move_selection_grid(0, 1)
+        elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+            return self.selected_index
         return None
     
+    def _option_at(self, pos):
+        """Get the option under a screen position from the grid cell size."""
+        col = (pos[0] - self.x) // self.cell_width
+        row = (pos[1] - self.y) // self.cell_height
+        if not (0 <= col < self.columns and row >= 0):
+            return -1
+        
+        index = (row * self.columns) + col
+        return index if index < len(self.options) else -1
+    
     def _move_selection_grid(self, row_delta, col_delta):
         """Move selection in grid."""
         current_row = self.selected_index // self.columns
@@ -384,39 +509,28 @@ class GridMenu(Menu):
         
         self.selected_index = new_index
     
-    def render(self, surface):
-        """Draw grid menu."""
+    def get_blit_seq(self):
+        """Get the blits that draw the grid menu, selection background included.
+        
+        The background pulses every frame, so it is blitted under the
+        pre-drawn labels rather than being part of them.
+        """
         if not self.visible:
-            return
+            return []
         
-        for i, option in enumerate(self.options):
-            row = i // self.columns
-            col = i % self.columns
-            
-            x_pos = self.x + (col * self.cell_width) + (self.cell_width // 2)
-            y_pos = self.y + (row * self.cell_height) + (self.cell_height // 2)
-            
-            is_selected = (i == self.selected_index)
-            
-            # Draw cell background if selected
-            if is_selected:
-                cell_rect = self.option_rects[i]
-                pulse = abs(pygame.math.Vector2(1, 0).rotate(self.pulse_timer * 60).x)
-                alpha = int(50 + (pulse * 50))
-                bg_surface = pygame.Surface((cell_rect.width, cell_rect.height))
-                bg_surface.set_alpha(alpha)
-                bg_surface.fill(self.selected_color)
-                surface.blit(bg_surface, cell_rect)
+        blit_seq = []
+        
+        if 0 <= self.selected_index < len(self.option_rects):
+            # Selected cell background pulses between 50 and 100 alpha
+            pulse = abs(math.cos(math.radians(self.pulse_timer * 60)))
+            alpha = int(50 + (pulse * 50))
             
-            # Choose color
-            if not self.enabled:
-                color = self.disabled_color
-            elif is_selected:
-                color = self.selected_color
-            else:
-                color = self.text_color
+            if self._selection_bg_color != self.selected_color:
+                self._selection_bg.fill(self.selected_color)
+                self._selection_bg_color = self.selected_color
             
-            # Render text
-            text_surface = self.font.render(option, True, color)
-            text_rect = text_surface.get_rect(center=(x_pos, y_pos))
-            surface.blit(text_surface, text_rect)
+            self._selection_bg.set_alpha(alpha)
+            blit_seq.append((self._selection_bg, self.option_rects[self.selected_index]))
+        
+        blit_seq.extend(super().get_blit_seq())
+        return blit_seq
@@ -5,6 +5,9 @@ Container widget for grouping UI elements.
 
 import pygame
 from utils.constants import UI_BG_COLOR, UI_BORDER_COLOR, WHITE
+from utils.helpers import to_display_format
+from utils.resource_loader import get_font
+from ui.text_cache import render_text
 
 
 class Panel:
@@ -32,6 +35,13 @@ class Panel:
         self.visible = True
         self.children = []  # List of child UI elements
         
+        # Children sorted by what they support, filled in add_child so the
+        # per-frame loops don't need hasattr checks. Renderable children
+        # are stored as (child, get_blit_seq, render) with one method set.
+        self._event_children = []
+        self._updatable_children = []
+        self._renderable_children = []
+        
         # Colors
         self.bg_color = UI_BG_COLOR
         self.border_color = UI_BORDER_COLOR
@@ -39,9 +49,15 @@ class Panel:
         self.border_width = 2
         
         # Title font
-        self.title_font = pygame.font.Font(None, 32)
+        self.title_font_size = 32
+        self.title_font = get_font(self.title_font_size)
         self.title_height = 40 if title else 0
         
+        # Pre-rendered background, border and title, and the state it was
+        # built from (colors can be changed directly after construction)
+        self._chrome_surface = None
+        self._chrome_key = None
+        
         # Content area (inside padding and below title)
         self.content_rect = pygame.Rect(
             x + padding,
@@ -58,6 +74,15 @@ class Panel:
             child: UI element with handle_event, update, and render methods
         """
         self.children.append(child)
+        
+        if hasattr(child, 'handle_event'):
+            self._event_children.append(child)
+        if hasattr(child, 'update'):
+            self._updatable_children.append(child)
+        if hasattr(child, 'get_blit_seq'):
+            self._renderable_children.append((child, child.get_blit_seq, None))
+        elif hasattr(child, 'render'):
+            self._renderable_children.append((child, None, child.render))
     
     def remove_child(self, child):
         """
@@ -68,10 +93,21 @@ class Panel:
         """
         if child in self.children:
             self.children.remove(child)
+            
+            if child in self._event_children:
+                self._event_children.remove(child)
+            if child in self._updatable_children:
+                self._updatable_children.remove(child)
+            self._renderable_children = [
+                entry for entry in self._renderable_children if entry[0] is not child
+            ]
     
     def clear_children(self):
         """Remove all child elements."""
         self.children.clear()
+        self._event_children.clear()
+        self._updatable_children.clear()
+        self._renderable_children.clear()
     
     def handle_event(self, event):
         """
@@ -84,9 +120,8 @@ class Panel:
             return
         
         # Pass event to all children
-        for child in self.children:
-            if hasattr(child, 'handle_event'):
-                child.handle_event(event)
+        for child in self._event_children:
+            child.handle_event(event)
     
     def update(self, dt):
         """
@@ -99,9 +134,8 @@ class Panel:
             return
         
         # Update all children
-        for child in self.children:
-            if hasattr(child, 'update'):
-                child.update(dt)
+        for child in self._updatable_children:
+            child.update(dt)
     
     def render(self, surface):
         """
@@ -113,33 +147,81 @@ class Panel:
         if not self.visible:
             return
         
+        # Draw background, border and title
+        surface.blit(self._get_chrome_surface(), self.rect)
+        
+        # Render all children
+        self._render_children(surface)
+    
+    def _get_chrome_surface(self):
+        """
+        Get the panel background, border and title as one surface.
+        
+        Rebuilt only when the size, colors, border or title change.
+        
+        Returns:
+            pygame.Surface the size of the panel
+        """
+        key = (self.rect.size, self.bg_color, self.border_color, self.border_width,
+               self.title, self.title_color, self.title_height, self.padding)
+        if key != self._chrome_key:
+            self._chrome_surface = self._build_chrome_surface()
+            self._chrome_key = key
+        return self._chrome_surface
+    
+    def _build_chrome_surface(self):
+        """Draw the panel background, border and title onto a new surface."""
+        width, height = self.rect.size
+        chrome = pygame.Surface((width, height))
+        local_rect = chrome.get_rect()
+        
         # Draw background
-        pygame.draw.rect(surface, self.bg_color, self.rect)
+        pygame.draw.rect(chrome, self.bg_color, local_rect)
         
         # Draw border
-        pygame.draw.rect(surface, self.border_color, self.rect, self.border_width)
+        pygame.draw.rect(chrome, self.border_color, local_rect, self.border_width)
         
         # Draw title if present
         if self.title:
-            title_surface = self.title_font.render(self.title, True, self.title_color)
-            title_x = self.rect.x + (self.rect.width - title_surface.get_width()) // 2
-            title_y = self.rect.y + 10
-            surface.blit(title_surface, (title_x, title_y))
+            title_surface = render_text(self.title, self.title_font_size, self.title_color)
+            title_x = (width - title_surface.get_width()) // 2
+            chrome.blit(title_surface, (title_x, 10))
             
             # Draw separator line below title
-            line_y = self.rect.y + self.title_height
             pygame.draw.line(
-                surface,
+                chrome,
                 self.border_color,
-                (self.rect.x + self.padding, line_y),
-                (self.rect.right - self.padding, line_y),
+                (self.padding, self.title_height),
+                (width - self.padding, self.title_height),
                 1
             )
         
-        # Render all children
-        for child in self.children:
-            if hasattr(child, 'render'):
-                child.render(surface)
+        return to_display_format(chrome)
+    
+    def _render_children(self, surface):
+        """
+        Draw all children in order.
+        
+        Children that provide get_blit_seq() (e.g. menus) are collected
+        and drawn with one surface.blits() call. The batch is flushed
+        before any child that draws itself, so overlap order is kept.
+        
+        Args:
+            surface: pygame.Surface to draw on
+        """
+        blit_seq = []
+        
+        for _, get_blit_seq, render in self._renderable_children:
+            if get_blit_seq is not None:
+                blit_seq.extend(get_blit_seq())
+            else:
+                if blit_seq:
+                    surface.blits(blit_seq, doreturn=False)
+                    blit_seq = []
+                render(surface)
+        
+        if blit_seq:
+            surface.blits(blit_seq, doreturn=False)
     
     def set_position(self, x, y):
         """
@@ -206,15 +288,28 @@ class ScrollablePanel(Panel):
         self.scroll_offset = 0
         self.max_scroll = 0
         self.content_height = 0
+        self._children_may_overflow = False
+        self._scroll_children = []  # Children with a rect to move when scrolling
         self._update_scroll_bounds()
     
     def _update_scroll_bounds(self):
-        """Calculate scroll boundaries based on children."""
+        """Calculate scroll boundaries based on children.
+        
+        Also notes whether any child may draw outside the content area,
+        which is the only case where rendering needs a clip rect. Children
+        without a rect could draw anywhere, so they count as overflowing.
+        """
         if not self.children:
             self.content_height = 0
             self.max_scroll = 0
+            self._children_may_overflow = False
             return
         
+        self._children_may_overflow = any(
+            not hasattr(child, 'rect') or not self.content_rect.contains(child.rect)
+            for child in self.children
+        )
+        
         # Find lowest child position
         max_y = 0
         for child in self.children:
@@ -235,20 +330,21 @@ class ScrollablePanel(Panel):
             mouse_pos = pygame.mouse.get_pos()
             if self.rect.collidepoint(mouse_pos):
                 # Scroll
-                self.scroll_offset -= event.y * 20
-                self.scroll_offset = max(0, min(self.scroll_offset, self.max_scroll))
+                scroll_offset = self.scroll_offset - event.y * 20
+                scroll_offset = max(0, min(scroll_offset, self.max_scroll))
                 
-                # Update child positions
-                self._apply_scroll()
+                # Update child positions (nothing to move if already at the end)
+                if scroll_offset != self.scroll_offset:
+                    self.scroll_offset = scroll_offset
+                    self._apply_scroll()
         
         # Pass to children
         super().handle_event(event)
     
     def _apply_scroll(self):
         """Apply scroll offset to children."""
-        for child in self.children:
-            if hasattr(child, 'rect') and hasattr(child, '_base_y'):
-                child.rect.y = child._base_y - self.scroll_offset
+        for child in self._scroll_children:
+            child.rect.y = child._base_y - self.scroll_offset
     
     def add_child(self, child):
         """Add child and store base position."""
@@ -257,45 +353,41 @@ class ScrollablePanel(Panel):
         # Store base Y position for scrolling
         if hasattr(child, 'rect'):
             child._base_y = child.rect.y
+            self._scroll_children.append(child)
         
         self._update_scroll_bounds()
     
+    def remove_child(self, child):
+        """Remove child and stop scrolling it."""
+        super().remove_child(child)
+        
+        if child in self._scroll_children:
+            self._scroll_children.remove(child)
+    
+    def clear_children(self):
+        """Remove all child elements."""
+        super().clear_children()
+        self._scroll_children.clear()
+    
     def render(self, surface):
         """Render with clipping for scroll area."""
         if not self.visible:
             return
         
-        # Draw background and border
-        pygame.draw.rect(surface, self.bg_color, self.rect)
-        pygame.draw.rect(surface, self.border_color, self.rect, self.border_width)
+        # Draw background, border and title
+        surface.blit(self._get_chrome_surface(), self.rect)
         
-        # Draw title
-        if self.title:
-            title_surface = self.title_font.render(self.title, True, self.title_color)
-            title_x = self.rect.x + (self.rect.width - title_surface.get_width()) // 2
-            title_y = self.rect.y + 10
-            surface.blit(title_surface, (title_x, title_y))
+        # Clip to the content area only if something can spill out of it
+        if self.max_scroll > 0 or self._children_may_overflow:
+            original_clip = surface.get_clip()
+            surface.set_clip(self.content_rect)
             
-            line_y = self.rect.y + self.title_height
-            pygame.draw.line(
-                surface,
-                self.border_color,
-                (self.rect.x + self.padding, line_y),
-                (self.rect.right - self.padding, line_y),
-                1
-            )
-        
-        # Set clipping for content area
-        original_clip = surface.get_clip()
-        surface.set_clip(self.content_rect)
-        
-        # Render children
-        for child in self.children:
-            if hasattr(child, 'render'):
-                child.render(surface)
-        
-        # Restore clip
-        surface.set_clip(original_clip)
+            self._render_children(surface)
+            
+            # Restore clip
+            surface.set_clip(original_clip)
+        else:
+            self._render_children(surface)
         
         # Draw scroll indicator
         if self.max_scroll > 0:
@@ -339,6 +431,7 @@ class ModalPanel(Panel):
         # Overlay
         self.overlay_color = (0, 0, 0, 180)  # Semi-transparent black
         self.overlay_surface = None
+        self._overlay_size = None
     
     def center_on_screen(self, screen_width, screen_height):
         """Center the modal on the screen."""
@@ -351,11 +444,14 @@ class ModalPanel(Panel):
         if not self.visible:
             return
         
-        # Create overlay surface if needed
-        if self.overlay_surface is None or self.overlay_surface.get_size() != surface.get_size():
-            self.overlay_surface = pygame.Surface(surface.get_size())
-            self.overlay_surface.set_alpha(180)
-            self.overlay_surface.fill((0, 0, 0))
+        # Build the overlay on first render, and again only if the target
+        # surface changes size
+        size = surface.get_size()
+        if size != self._overlay_size:
+            self.overlay_surface = pygame.Surface(size, pygame.SRCALPHA)
+            self.overlay_surface.fill(self.overlay_color)
+            self.overlay_surface = to_display_format(self.overlay_surface, alpha=True)
+            self._overlay_size = size
         
         # Draw overlay
         surface.blit(self.overlay_surface, (0, 0))
@@ -9,12 +9,19 @@ from entities.character import Character
 from systems.party_manager import PartyManager, CrewMember
 from ui.panel import Panel
 from ui.button import Button
+from ui.text_cache import render_text
+from utils.helpers import to_display_format
 from utils.constants import *
 
 
 class PartyMemberCard:
     """Visual card displaying a single party member's info."""
 
+    # Font sizes (text is rendered through the shared text cache)
+    NAME_FONT_SIZE = 24
+    INFO_FONT_SIZE = 20
+    SMALL_FONT_SIZE = 18
+
     def __init__(self, x: int, y: int, width: int, height: int):
         """
         Initialize party member card.
@@ -27,6 +34,7 @@ class PartyMemberCard:
         """
         self.rect = pygame.Rect(x, y, width, height)
         self.member: Optional[Character] = None
+        self._role_text: Optional[str] = None  # Only crew members have a role
         self.is_selected = False
         self.is_active = True  # Active vs Reserve
 
@@ -36,10 +44,23 @@ class PartyMemberCard:
         self.border_color = UI_BORDER_COLOR
         self.text_color = WHITE
 
-        # Fonts
-        self.name_font = pygame.font.Font(None, 24)
-        self.info_font = pygame.font.Font(None, 20)
-        self.small_font = pygame.font.Font(None, 18)
+        # Pre-drawn background/border per card state (see _get_chrome_surface)
+        self._chrome_surfaces = {}
+
+        # HP bar fill for the last HP seen: (hp, max_hp, bar_width, fill_width, color)
+        self._hp_cache = (None, None, None, 0, None)
+
+        # Name and HP labels with the values they were rendered from, so
+        # the strings are only formatted (and the HP label centered) when
+        # a value changes
+        self._name_key = None
+        self._name_surface: Optional[pygame.Surface] = None
+        self._hp_key = None
+        self._hp_blit: Optional[tuple] = None
+
+        # HP bar rects reused every frame (updated in place before drawing)
+        self._hp_bar_rect = pygame.Rect(0, 0, 0, 0)
+        self._fill_rect = pygame.Rect(0, 0, 0, 0)
 
     def set_member(self, member: Optional[Character], is_active: bool = True):
         """
@@ -52,6 +73,15 @@ class PartyMemberCard:
         self.member = member
         self.is_active = is_active
 
+        # Resolve the role line once instead of on every render
+        if isinstance(member, CrewMember):
+            if member.epithet:
+                self._role_text = f'"{member.epithet}" - {member.role}'
+            else:
+                self._role_text = f"{member.role}"
+        else:
+            self._role_text = None
+
     def set_selected(self, selected: bool):
         """Set selection state."""
         self.is_selected = selected
@@ -62,73 +92,111 @@ class PartyMemberCard:
 
     def render(self, surface: pygame.Surface):
         """Render the card."""
+        surface.blit(*self.get_chrome_blit())
+        self.render_details(surface)
+
+    def get_chrome_blit(self):
+        """
+        Get the blit for the card's background and border.
+
+        Empty slots are fully drawn by this blit. The menu batches these
+        for all cards into one surface.blits() call.
+
+        Returns:
+            (surface, position) tuple
+        """
+        return self._get_chrome_surface(), self.rect.topleft
+
+    def _get_chrome_surface(self) -> pygame.Surface:
+        """Get the pre-drawn chrome for the card's current state."""
+        key = (self.member is None, self.is_selected,
+               self.bg_color, self.selected_color, self.border_color)
+        chrome = self._chrome_surfaces.get(key)
+        if chrome is None:
+            chrome = self._build_chrome_surface()
+            self._chrome_surfaces[key] = chrome
+        return chrome
+
+    def _build_chrome_surface(self) -> pygame.Surface:
+        """Draw the card background and border onto a new surface."""
+        chrome = pygame.Surface(self.rect.size)
+        local_rect = chrome.get_rect()
+
         if not self.member:
             # Draw empty slot
-            pygame.draw.rect(surface, DARK_GRAY, self.rect)
-            pygame.draw.rect(surface, self.border_color, self.rect, 1)
+            pygame.draw.rect(chrome, DARK_GRAY, local_rect)
+            pygame.draw.rect(chrome, self.border_color, local_rect, 1)
 
-            text = self.info_font.render("Empty Slot", True, LIGHT_GRAY)
-            text_x = self.rect.centerx - text.get_width() // 2
-            text_y = self.rect.centery - text.get_height() // 2
-            surface.blit(text, (text_x, text_y))
-            return
+            text = render_text("Empty Slot", self.INFO_FONT_SIZE, LIGHT_GRAY)
+            text_x = local_rect.centerx - text.get_width() // 2
+            text_y = local_rect.centery - text.get_height() // 2
+            chrome.blit(text, (text_x, text_y))
+            return to_display_format(chrome)
 
         # Draw background
         bg_color = self.selected_color if self.is_selected else self.bg_color
-        pygame.draw.rect(surface, bg_color, self.rect)
+        pygame.draw.rect(chrome, bg_color, local_rect)
 
         # Draw border (thicker if selected)
         border_width = 3 if self.is_selected else 2
-        pygame.draw.rect(surface, self.border_color, self.rect, border_width)
+        pygame.draw.rect(chrome, self.border_color, local_rect, border_width)
+
+        return to_display_format(chrome)
+
+    def render_details(self, surface: pygame.Surface):
+        """
+        Render the member info on top of the card chrome.
+
+        Args:
+            surface: Surface to draw on
+        """
+        if not self.member:
+            return
 
         # Draw member info
         padding = 10
         y_offset = self.rect.y + padding
 
         # Name and level
-        name_text = f"{self.member.name} Lv.{self.member.level}"
-        name_surface = self.name_font.render(name_text, True, self.text_color)
-        surface.blit(name_surface, (self.rect.x + padding, y_offset))
+        name_key = (self.member.name, self.member.level, self.text_color)
+        if name_key != self._name_key:
+            name_text = f"{self.member.name} Lv.{self.member.level}"
+            self._name_surface = render_text(name_text, self.NAME_FONT_SIZE, self.text_color)
+            self._name_key = name_key
+        surface.blit(self._name_surface, (self.rect.x + padding, y_offset))
         y_offset += 25
 
         # Role (if CrewMember)
-        if isinstance(self.member, CrewMember):
-            role_text = f"{self.member.role}"
-            if self.member.epithet:
-                role_text = f'"{self.member.epithet}" - {self.member.role}'
-            role_surface = self.small_font.render(role_text, True, LIGHT_GRAY)
+        if self._role_text is not None:
+            role_surface = render_text(self._role_text, self.SMALL_FONT_SIZE, LIGHT_GRAY)
             surface.blit(role_surface, (self.rect.x + padding, y_offset))
             y_offset += 20
 
         # HP bar
-        hp_percent = self.member.current_hp / self.member.max_hp if self.member.max_hp > 0 else 0
         bar_width = self.rect.width - (padding * 2)
         bar_height = 20
 
-        hp_bar_rect = pygame.Rect(self.rect.x + padding, y_offset, bar_width, bar_height)
-        pygame.draw.rect(surface, DARK_GRAY, hp_bar_rect)
+        hp_bar_rect = self._hp_bar_rect
+        hp_bar_rect.update(self.rect.x + padding, y_offset, bar_width, bar_height)
+        surface.fill(DARK_GRAY, hp_bar_rect)
 
-        if hp_percent > 0:
-            fill_width = int(bar_width * hp_percent)
-            fill_rect = pygame.Rect(self.rect.x + padding, y_offset, fill_width, bar_height)
-
-            if hp_percent > 0.5:
-                hp_color = GREEN
-            elif hp_percent > 0.25:
-                hp_color = YELLOW
-            else:
-                hp_color = RED
-
-            pygame.draw.rect(surface, hp_color, fill_rect)
+        fill_width, hp_color = self._get_hp_fill(bar_width)
+        if hp_color:
+            self._fill_rect.update(self.rect.x + padding, y_offset, fill_width, bar_height)
+            surface.fill(hp_color, self._fill_rect)
 
         pygame.draw.rect(surface, self.border_color, hp_bar_rect, 1)
 
         # HP text
-        hp_text = f"HP: {self.member.current_hp}/{self.member.max_hp}"
-        hp_surface = self.small_font.render(hp_text, True, WHITE)
-        hp_x = hp_bar_rect.centerx - hp_surface.get_width() // 2
-        hp_y = hp_bar_rect.centery - hp_surface.get_height() // 2
-        surface.blit(hp_surface, (hp_x, hp_y))
+        hp_key = (self.member.current_hp, self.member.max_hp, hp_bar_rect.center)
+        if hp_key != self._hp_key:
+            hp_text = f"HP: {self.member.current_hp}/{self.member.max_hp}"
+            hp_surface = render_text(hp_text, self.SMALL_FONT_SIZE, WHITE)
+            hp_x = hp_bar_rect.centerx - hp_surface.get_width() // 2
+            hp_y = hp_bar_rect.centery - hp_surface.get_height() // 2
+            self._hp_blit = (hp_surface, (hp_x, hp_y))
+            self._hp_key = hp_key
+        surface.blit(*self._hp_blit)
         y_offset += 25
 
         # Status indicator
@@ -142,9 +210,39 @@ class PartyMemberCard:
             status_text = "RESERVE"
             status_color = CYAN
 
-        status_surface = self.small_font.render(status_text, True, status_color)
+        status_surface = render_text(status_text, self.SMALL_FONT_SIZE, status_color)
         surface.blit(status_surface, (self.rect.x + padding, y_offset))
 
+    def _get_hp_fill(self, bar_width: int) -> tuple:
+        """
+        Get the HP bar fill, recomputed only when the member's HP changes.
+
+        Args:
+            bar_width: Width of the full HP bar
+
+        Returns:
+            (fill_width, color) tuple, color is None if there is no HP
+        """
+        current_hp = self.member.current_hp
+        max_hp = self.member.max_hp
+        if (current_hp, max_hp, bar_width) != self._hp_cache[:3]:
+            hp_percent = current_hp / max_hp if max_hp > 0 else 0
+
+            if hp_percent <= 0:
+                fill_width, hp_color = 0, None
+            else:
+                fill_width = int(bar_width * hp_percent)
+                if hp_percent > 0.5:
+                    hp_color = GREEN
+                elif hp_percent > 0.25:
+                    hp_color = YELLOW
+                else:
+                    hp_color = RED
+
+            self._hp_cache = (current_hp, max_hp, bar_width, fill_width, hp_color)
+
+        return self._hp_cache[3:]
+
 
 class PartyMenu:
     """
@@ -152,6 +250,11 @@ class PartyMenu:
     Shows active and reserve members, allows switching.
     """
 
+    # Font sizes (text is rendered through the shared text cache)
+    TITLE_FONT_SIZE = 36
+    SECTION_FONT_SIZE = 28
+    INFO_FONT_SIZE = 22
+
     def __init__(self, screen_width: int, screen_height: int):
         """
         Initialize party menu.
@@ -176,15 +279,44 @@ class PartyMenu:
         # Background panel
         self.panel = Panel(self.panel_x, self.panel_y, self.panel_width, self.panel_height)
 
+        # Snapshot of the rendered panel, reused until something changes
+        self._snapshot_member_state = None
+        self._dirty = True
+
+        # Screen area covered by the overlay
+        self._overlay_rect = pygame.Rect(0, 0, screen_width, screen_height)
+
         # Member cards
         self.active_cards: List[PartyMemberCard] = []
         self.reserve_cards: List[PartyMemberCard] = []
-        self._create_member_cards()
+        self._all_cards: List[PartyMemberCard] = []
 
         # Selection
         self.selected_card: Optional[PartyMemberCard] = None
         self.selected_for_swap: Optional[PartyMemberCard] = None
 
+        # Callbacks
+        self.on_close: Optional[Callable] = None
+
+        # Surfaces, cards, buttons and labels are built on first show(), so
+        # a menu that is never opened costs nothing
+        self._built = False
+
+    def _ensure_built(self):
+        """Build the menu's surfaces, cards, buttons and labels if not done yet."""
+        if self._built:
+            return
+        self._built = True
+
+        # Semi-transparent overlay, built once
+        self._overlay = pygame.Surface(self._overlay_rect.size, pygame.SRCALPHA)
+        self._overlay.fill((0, 0, 0, 200))
+        self._overlay = to_display_format(self._overlay, alpha=True)
+
+        self._menu_snapshot = to_display_format(pygame.Surface(self.panel.rect.size))
+
+        self._create_member_cards()
+
         # Buttons
         self.close_button = Button(
             self.panel_x + self.panel_width - 120,
@@ -199,13 +331,26 @@ class PartyMenu:
         )
         self.swap_button.set_enabled(False)
 
-        # Callbacks
-        self.on_close: Optional[Callable] = None
-
-        # Fonts
-        self.title_font = pygame.font.Font(None, 36)
-        self.section_font = pygame.font.Font(None, 28)
-        self.info_font = pygame.font.Font(None, 22)
+        # Title and section labels never change, so they are rendered and
+        # positioned once
+        title_surface = render_text("Party Management", self.TITLE_FONT_SIZE, WHITE)
+        title_x = self.panel_x + (self.panel_width - title_surface.get_width()) // 2
+        self._label_blits = [
+            (title_surface, (title_x, self.panel_y + 15)),
+            (render_text("Active Party (4/4)", self.SECTION_FONT_SIZE, CYAN),
+             (self.panel_x + 20, self.panel_y + 55)),
+            (render_text("Reserve (6/6)", self.SECTION_FONT_SIZE, LIGHT_GRAY),
+             (self.panel_x + 20, self.panel_y + 375)),
+        ]
+
+        # Swap instructions, centered once
+        instruction = "Select another member to swap (Active ↔ Reserve)"
+        instruction_surface = render_text(instruction, self.INFO_FONT_SIZE, YELLOW)
+        instruction_x = self.panel_x + (self.panel_width - instruction_surface.get_width()) // 2
+        self._instruction_blit = (
+            instruction_surface,
+            (instruction_x, self.panel_y + self.panel_height - 100)
+        )
 
     def _create_member_cards(self):
         """Create member card slots."""
@@ -231,6 +376,9 @@ class PartyMenu:
             card.is_active = False
             self.reserve_cards.append(card)
 
+        # Every card, active first (the slot layout never changes)
+        self._all_cards = self.active_cards + self.reserve_cards
+
     def set_party_manager(self, party_manager: PartyManager):
         """
         Set the party manager to display.
@@ -262,16 +410,21 @@ class PartyMenu:
             else:
                 card.set_member(None, is_active=False)
 
+        self._dirty = True
+
     def show(self):
         """Show the menu."""
         self.visible = True
+        self._ensure_built()
         self._update_cards()
+        self._dirty = True
 
     def hide(self):
         """Hide the menu."""
         self.visible = False
         self.selected_card = None
         self.selected_for_swap = None
+        self._dirty = True
 
     def handle_event(self, event: pygame.event.Event):
         """
@@ -286,6 +439,10 @@ class PartyMenu:
         if event.type == pygame.MOUSEBUTTONDOWN:
             mouse_x, mouse_y = event.pos
 
+            # Buttons and cards are all inside the panel
+            if not self.panel.rect.collidepoint(mouse_x, mouse_y):
+                return
+
             # Check close button
             if self.close_button.contains_point(mouse_x, mouse_y):
                 self.hide()
@@ -299,7 +456,7 @@ class PartyMenu:
                 return
 
             # Check member cards
-            for card in self.active_cards + self.reserve_cards:
+            for card in self._all_cards:
                 if card.contains_point(mouse_x, mouse_y) and card.member:
                     self._select_card(card)
                     break
@@ -317,6 +474,8 @@ class PartyMenu:
         Args:
             card: Card to select
         """
+        self._dirty = True
+
         # Clear previous selection
         if self.selected_card:
             self.selected_card.set_selected(False)
@@ -387,6 +546,7 @@ class PartyMenu:
         self.selected_for_swap = None
         self.selected_card = None
         self.swap_button.set_enabled(False)
+        self._dirty = True
 
     def update(self, dt: float):
         """
@@ -409,32 +569,45 @@ class PartyMenu:
             return
 
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
+        surface.blit(self._overlay, (0, 0))
+
+        # Reuse the last rendered panel unless something changed. HP and
+        # levels can change outside the menu, so those are compared too.
+        member_state = self._get_member_state()
+        if self._dirty or member_state != self._snapshot_member_state:
+            self._render_menu(surface)
+            self._menu_snapshot.blit(surface, (0, 0), self.panel.rect)
+            self._snapshot_member_state = member_state
+            self._dirty = False
+        else:
+            surface.blit(self._menu_snapshot, self.panel.rect)
+
+    def _get_member_state(self) -> tuple:
+        """Get the displayed member values that can change while the menu is open."""
+        return tuple(
+            (card.member.current_hp, card.member.max_hp, card.member.level, card.member.is_alive)
+            for card in self._all_cards
+            if card.member
+        )
 
+    def _render_menu(self, surface: pygame.Surface):
+        """
+        Render the panel and everything on it.
+
+        Args:
+            surface: Surface to draw on
+        """
         # Draw panel
         self.panel.render(surface)
 
-        # Draw title
-        title_surface = self.title_font.render("Party Management", True, WHITE)
-        title_x = self.panel_x + (self.panel_width - title_surface.get_width()) // 2
-        surface.blit(title_surface, (title_x, self.panel_y + 15))
-
-        # Draw section labels
-        active_label = self.section_font.render("Active Party (4/4)", True, CYAN)
-        surface.blit(active_label, (self.panel_x + 20, self.panel_y + 55))
-
-        reserve_label = self.section_font.render("Reserve (6/6)", True, LIGHT_GRAY)
-        surface.blit(reserve_label, (self.panel_x + 20, self.panel_y + 375))
+        # Draw title and section labels
+        surface.blits(self._label_blits, doreturn=False)
 
-        # Draw member cards
-        for card in self.active_cards:
-            card.render(surface)
+        # Draw member cards: all card backgrounds in one batch, then details
+        surface.blits([card.get_chrome_blit() for card in self._all_cards], doreturn=False)
 
-        for card in self.reserve_cards:
-            card.render(surface)
+        for card in self._all_cards:
+            card.render_details(surface)
 
         # Draw buttons
         self.close_button.render(surface)
@@ -442,10 +615,7 @@ class PartyMenu:
 
         # Draw instructions
         if self.selected_for_swap:
-            instruction = "Select another member to swap (Active ↔ Reserve)"
-            instruction_surface = self.info_font.render(instruction, True, YELLOW)
-            instruction_x = self.panel_x + (self.panel_width - instruction_surface.get_width()) // 2
-            surface.blit(instruction_surface, (instruction_x, self.panel_y + self.panel_height - 100))
+            surface.blit(*self._instruction_blit)
 
     def set_visible(self, visible: bool):
         """Set menu visibility."""
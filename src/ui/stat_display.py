@@ -4,9 +4,12 @@ Displays character statistics in a formatted panel.
 """
 
 import pygame
+from collections import OrderedDict
 from typing import Optional
 from entities.character import Character
 from utils.constants import *
+from ui.text_cache import render_text
+from utils.helpers import to_display_format
 
 
 class StatDisplay:
@@ -15,6 +18,14 @@ class StatDisplay:
     Shows HP, AP, and all base stats.
     """
     
+    # Font sizes (text is rendered through the shared text cache)
+    HEADER_FONT_SIZE = 24
+    STAT_FONT_SIZE = 20
+    VALUE_FONT_SIZE = 20
+    
+    # Number of drawn HP/AP bars kept (see _get_bar_surface)
+    BAR_CACHE_SIZE = 32
+    
     def __init__(self, x: int, y: int, width: int = 250, height: int = 200):
         """
         Initialize stat display.
@@ -33,11 +44,6 @@ class StatDisplay:
         # Character data
         self.character: Optional[Character] = None
         
-        # Fonts
-        self.header_font = pygame.font.Font(None, 24)
-        self.stat_font = pygame.font.Font(None, 20)
-        self.value_font = pygame.font.Font(None, 20)
-        
         # Colors
         self.bg_color = (30, 30, 50)
         self.border_color = UI_BORDER_COLOR
@@ -46,6 +52,22 @@ class StatDisplay:
         self.value_color = WHITE
         self.hp_color = GREEN
         self.ap_color = CYAN
+        
+        # Value labels with the values they were rendered from, so the
+        # strings are only formatted when a value changes
+        self._level_key = None
+        self._level_surface: Optional[pygame.Surface] = None
+        self._hp_key = None
+        self._hp_surface: Optional[pygame.Surface] = None
+        self._ap_key = None
+        self._ap_surface: Optional[pygame.Surface] = None
+        
+        # Background rect reused every frame (updated in place before drawing)
+        self._bg_rect = pygame.Rect(0, 0, 0, 0)
+        
+        # Drawn bars keyed by (fill_width, bar_width, bar_height, color),
+        # least recently used first
+        self._bar_surfaces = OrderedDict()
     
     def set_character(self, character: Character):
         """
@@ -77,8 +99,9 @@ class StatDisplay:
             return
         
         # Draw background
-        bg_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        pygame.draw.rect(screen, self.bg_color, bg_rect)
+        bg_rect = self._bg_rect
+        bg_rect.update(self.x, self.y, self.width, self.height)
+        screen.fill(self.bg_color, bg_rect)
         pygame.draw.rect(screen, self.border_color, bg_rect, 2)
         
         # Draw header
@@ -92,11 +115,12 @@ class StatDisplay:
     
     def _render_placeholder(self, screen: pygame.Surface):
         """Render placeholder when no character is set."""
-        bg_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        pygame.draw.rect(screen, GRAY, bg_rect)
+        bg_rect = self._bg_rect
+        bg_rect.update(self.x, self.y, self.width, self.height)
+        screen.fill(GRAY, bg_rect)
         pygame.draw.rect(screen, WHITE, bg_rect, 2)
         
-        text = self.header_font.render("No Character", True, WHITE)
+        text = render_text("No Character", self.HEADER_FONT_SIZE, WHITE)
         text_rect = text.get_rect(
             center=(self.x + self.width // 2, self.y + self.height // 2)
         )
@@ -104,15 +128,19 @@ class StatDisplay:
     
     def _render_header(self, screen: pygame.Surface):
         """Render the header section."""
-        header_text = self.header_font.render("Stats", True, self.header_color)
+        header_text = render_text("Stats", self.HEADER_FONT_SIZE, self.header_color)
         screen.blit(header_text, (self.x + 10, self.y + 10))
         
         # Level
-        level_text = self.stat_font.render(
-            f"Lv. {self.character.level}",
-            True,
-            self.value_color
-        )
+        level_key = (self.character.level, self.value_color)
+        if level_key != self._level_key:
+            self._level_surface = render_text(
+                f"Lv. {self.character.level}",
+                self.STAT_FONT_SIZE,
+                self.value_color
+            )
+            self._level_key = level_key
+        level_text = self._level_surface
         screen.blit(
             level_text,
             (self.x + self.width - level_text.get_width() - 10, self.y + 12)
@@ -132,15 +160,18 @@ class StatDisplay:
         vitals_y = self.y + 50
         
         # HP
-        hp_label = self.stat_font.render("HP:", True, self.label_color)
+        hp_label = render_text("HP:", self.STAT_FONT_SIZE, self.label_color)
         screen.blit(hp_label, (self.x + 10, vitals_y))
         
-        hp_text = self.value_font.render(
-            f"{self.character.current_hp}/{self.character.max_hp}",
-            True,
-            self.hp_color
-        )
-        screen.blit(hp_text, (self.x + 50, vitals_y))
+        hp_key = (self.character.current_hp, self.character.max_hp, self.hp_color)
+        if hp_key != self._hp_key:
+            self._hp_surface = render_text(
+                f"{self.character.current_hp}/{self.character.max_hp}",
+                self.VALUE_FONT_SIZE,
+                self.hp_color
+            )
+            self._hp_key = hp_key
+        screen.blit(self._hp_surface, (self.x + 50, vitals_y))
         
         # HP bar
         bar_width = self.width - 70
@@ -148,46 +179,75 @@ class StatDisplay:
         bar_x = self.x + 50
         bar_y = vitals_y + 25
         
-        # Background
-        bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-        pygame.draw.rect(screen, (50, 50, 50), bg_rect)
-        
-        # Fill
         hp_percent = self.character.get_hp_percentage()
         fill_width = int(bar_width * hp_percent)
-        fill_rect = pygame.Rect(bar_x, bar_y, fill_width, bar_height)
-        pygame.draw.rect(screen, self.hp_color, fill_rect)
-        
-        # Border
-        pygame.draw.rect(screen, WHITE, bg_rect, 1)
+        hp_bar = self._get_bar_surface(fill_width, bar_width, bar_height, self.hp_color)
+        screen.blit(hp_bar, (bar_x, bar_y))
         
         # AP
         ap_y = vitals_y + 40
-        ap_label = self.stat_font.render("AP:", True, self.label_color)
+        ap_label = render_text("AP:", self.STAT_FONT_SIZE, self.label_color)
         screen.blit(ap_label, (self.x + 10, ap_y))
         
-        ap_text = self.value_font.render(
-            f"{self.character.current_ap}/{self.character.max_ap}",
-            True,
-            self.ap_color
-        )
-        screen.blit(ap_text, (self.x + 50, ap_y))
+        ap_key = (self.character.current_ap, self.character.max_ap, self.ap_color)
+        if ap_key != self._ap_key:
+            self._ap_surface = render_text(
+                f"{self.character.current_ap}/{self.character.max_ap}",
+                self.VALUE_FONT_SIZE,
+                self.ap_color
+            )
+            self._ap_key = ap_key
+        screen.blit(self._ap_surface, (self.x + 50, ap_y))
         
         # AP bar
         ap_bar_y = ap_y + 25
         
+        ap_percent = self.character.get_ap_percentage()
+        fill_width = int(bar_width * ap_percent)
+        ap_bar = self._get_bar_surface(fill_width, bar_width, bar_height, self.ap_color)
+        screen.blit(ap_bar, (bar_x, ap_bar_y))
+    
+    def _get_bar_surface(self, fill_width: int, bar_width: int, bar_height: int,
+                         color: tuple) -> pygame.Surface:
+        """
+        Get a drawn HP/AP bar, drawing it on first use.
+        
+        A bar can only be filled to a whole number of pixels, so each
+        fill level is drawn (background, fill and border) once and
+        reused while the value doesn't change.
+        
+        Args:
+            fill_width: Filled width in pixels
+            bar_width: Full bar width
+            bar_height: Bar height
+            color: Fill color
+        
+        Returns:
+            pygame.Surface with the bar
+        """
+        key = (fill_width, bar_width, bar_height, color)
+        bar = self._bar_surfaces.get(key)
+        if bar is not None:
+            self._bar_surfaces.move_to_end(key)
+            return bar
+        
+        bar = pygame.Surface((bar_width, bar_height))
+        bar_rect = bar.get_rect()
+        
         # Background
-        bg_rect = pygame.Rect(bar_x, ap_bar_y, bar_width, bar_height)
-        pygame.draw.rect(screen, (50, 50, 50), bg_rect)
+        bar.fill((50, 50, 50))
         
         # Fill
-        ap_percent = self.character.get_ap_percentage()
-        fill_width = int(bar_width * ap_percent)
-        fill_rect = pygame.Rect(bar_x, ap_bar_y, fill_width, bar_height)
-        pygame.draw.rect(screen, self.ap_color, fill_rect)
+        bar.fill(color, pygame.Rect(0, 0, fill_width, bar_height))
         
         # Border
-        pygame.draw.rect(screen, WHITE, bg_rect, 1)
+        pygame.draw.rect(bar, WHITE, bar_rect, 1)
+        
+        bar = to_display_format(bar)
+        self._bar_surfaces[key] = bar
+        if len(self._bar_surfaces) > self.BAR_CACHE_SIZE:
+            self._bar_surfaces.popitem(last=False)
+        return bar
     
     def _render_stats(self, screen: pygame.Surface):
         """Render base character stats."""
@@ -203,6 +263,16 @@ class StatDisplay:
             ("WILL", self.character.stats.get_willpower()),
         ]
         
+        # Stats boosted by the Devil Fruit (depends on the current form,
+        # so fetched once per render rather than once per stat)
+        devil_fruit = self.character.devil_fruit
+        if devil_fruit:
+            bonus_stats = (devil_fruit.get_stat_modifiers().keys()
+                           | devil_fruit.get_percent_modifiers().keys())
+            fruit_color = self._get_fruit_color()
+        else:
+            bonus_stats = ()
+        
         # Render in two columns
         col1_x = self.x + 15
         col2_x = self.x + self.width // 2 + 15
@@ -218,28 +288,18 @@ class StatDisplay:
                 y = stats_start_y + (i - 3) * line_height
             
             # Stat name
-            label = self.stat_font.render(f"{stat_name}:", True, self.label_color)
+            label = render_text(f"{stat_name}:", self.STAT_FONT_SIZE, self.label_color)
             screen.blit(label, (x, y))
             
             # Stat value
-            value = self.value_font.render(str(stat_value), True, self.value_color)
+            value = render_text(str(stat_value), self.VALUE_FONT_SIZE, self.value_color)
             value_x = x + 50
             screen.blit(value, (value_x, y))
             
             # Bonus indicator if from Devil Fruit
-            if self.character.devil_fruit:
-                modifiers = self.character.devil_fruit.get_stat_modifiers()
-                percent_mods = self.character.devil_fruit.get_percent_modifiers()
-                
-                # Check if this stat has a bonus
-                stat_key = stat_name.lower()
-                has_bonus = (stat_key in modifiers or stat_key in percent_mods)
-                
-                if has_bonus:
-                    # Draw fruit indicator
-                    fruit_color = self._get_fruit_color()
-                    bonus_marker = self.stat_font.render("+", True, fruit_color)
-                    screen.blit(bonus_marker, (value_x + value.get_width() + 5, y))
+            if stat_name.lower() in bonus_stats:
+                bonus_marker = render_text("+", self.STAT_FONT_SIZE, fruit_color)
+                screen.blit(bonus_marker, (value_x + value.get_width() + 5, y))
     
     def _get_fruit_color(self) -> tuple:
         """
@@ -5,6 +5,8 @@ Widget for displaying text with word wrapping and formatting.
 
 import pygame
 from utils.constants import WHITE, BLACK, UI_BG_COLOR, UI_BORDER_COLOR
+from utils.helpers import to_display_format
+from utils.resource_loader import get_font
 
 
 class TextBox:
@@ -29,6 +31,10 @@ class TextBox:
         self.text = text
         self.padding = padding
         
+        # Text area inside the padding, kept in step with rect by
+        # set_position and set_size
+        self._clip_rect = self.rect.inflate(-padding * 2, -padding * 2)
+        
         # State
         self.visible = True
         self.scrollable = False
@@ -42,50 +48,59 @@ class TextBox:
         self.border_width = 2
         
         # Font
-        self.font = pygame.font.Font(None, font_size)
+        self.font = get_font(font_size)
         self.line_height = self.font.get_height() + 4
         
-        # Text rendering
+        # Space and per-character glyph advances, used to guess how many
+        # words fit on a line before measuring
+        self._space_width = self.font.size(' ')[0]
+        self._glyph_advances = {}
+        
+        # Text rendering. Rendered lines are kept until the text or color
+        # changes.
         self.wrapped_lines = []
+        self._line_surfaces = None
+        self._line_color = None
+        
+        # (line count, unfinished line, text from the last word on) saved
+        # before wrapping the last word, so appended text only wraps from there
+        self._wrap_state = None
         self._wrap_text()
     
     def _wrap_text(self):
         """Wrap text to fit within the box width."""
         self.wrapped_lines = []
+        self._line_surfaces = None
+        self._wrap_state = None
         
         if not self.text:
             return
         
-        words = self.text.split(' ')
-        current_line = []
-        max_width = self.rect.width - (self.padding * 2)
+        self._wrap_from(self.text, [])
+    
+    def _wrap_from(self, text, current_line):
+        """
+        Wrap text onto the end of wrapped_lines.
         
-        for word in words:
-            # Check for manual line breaks
-            if '\n' in word:
-                parts = word.split('\n')
-                for i, part in enumerate(parts):
-                    if i > 0:
-                        # Add current line and start new one
-                        if current_line:
-                            self.wrapped_lines.append(' '.join(current_line))
-                            current_line = []
-                    if part:
-                        current_line.append(part)
-                continue
-            
-            # Try adding word to current line
-            test_line = current_line + [word]
-            test_text = ' '.join(test_line)
-            test_surface = self.font.render(test_text, True, self.text_color)
-            
-            if test_surface.get_width() <= max_width:
-                current_line.append(word)
-            else:
-                # Word doesn't fit, start new line
-                if current_line:
-                    self.wrapped_lines.append(' '.join(current_line))
-                current_line = [word]
+        The text from its last word on is wrapped separately so the state
+        before it can be saved: appended text may continue that word, and
+        append_text resumes wrapping from there.
+        
+        Args:
+            text: Text to wrap
+            current_line: Words already on the unfinished last line
+        """
+        # Start of the last word (scanning back from the end is much
+        # cheaper than a regex anchored at the end on long text)
+        split_at = len(text.rstrip())
+        while split_at > 0 and not text[split_at - 1].isspace():
+            split_at -= 1
+        if not text[split_at:].strip():
+            split_at = len(text)
+        
+        current_line = self._wrap_paragraphs(text[:split_at], current_line)
+        self._wrap_state = (len(self.wrapped_lines), current_line[:], text[split_at:])
+        current_line = self._wrap_paragraphs(text[split_at:], current_line)
         
         # Add remaining line
         if current_line:
@@ -96,6 +111,150 @@ class TextBox:
         visible_height = self.rect.height - (self.padding * 2)
         self.max_scroll = max(0, total_height - visible_height)
         self.scrollable = self.max_scroll > 0
+        
+        # Scroll indicator height and how far it can move, which only
+        # change with the wrapped text or box size
+        visible_ratio = visible_height / total_height if total_height else 1
+        self._indicator_height = max(20, int(visible_height * visible_ratio))
+        self._indicator_travel = visible_height - self._indicator_height
+    
+    def _wrap_paragraphs(self, text, current_line):
+        """
+        Wrap text, adding every finished line to wrapped_lines.
+        
+        Manual line breaks end the current line. Words are split on any
+        whitespace, so runs of spaces collapse to one.
+        
+        Args:
+            text: Text to wrap
+            current_line: Words already on the unfinished line
+        
+        Returns:
+            Words on the unfinished line after wrapping
+        """
+        current_line = list(current_line)
+        max_width = self.rect.width - (self.padding * 2)
+        
+        # Estimated width of the current line
+        line_width = self.font.size(' '.join(current_line))[0] if current_line else 0
+        
+        for paragraph_index, paragraph in enumerate(text.split('\n')):
+            if paragraph_index > 0 and current_line:
+                # Manual line break: add current line and start new one
+                self.wrapped_lines.append(' '.join(current_line))
+                current_line = []
+                line_width = 0
+            
+            words = paragraph.split()
+            word_widths = self._estimate_word_widths(words)
+            
+            index = 0
+            while index < len(words):
+                # Add as many of the following words as fit on the current line
+                count = self._count_fitting_words(
+                    current_line, line_width, words, word_widths, index, max_width
+                )
+                if count:
+                    spaces = count if current_line else count - 1
+                    line_width += sum(word_widths[index:index + count]) + spaces * self._space_width
+                    current_line.extend(words[index:index + count])
+                    index += count
+                
+                if index < len(words):
+                    # Next word doesn't fit, start new line
+                    if current_line:
+                        self.wrapped_lines.append(' '.join(current_line))
+                    current_line = [words[index]]
+                    line_width = word_widths[index]
+                    index += 1
+        
+        return current_line
+    
+    def _estimate_word_widths(self, words):
+        """
+        Estimate word widths by adding up glyph advances.
+        
+        Advances come from font.metrics() and are kept per character, so
+        each new character costs one call. The estimate ignores kerning,
+        so it is only used to guess line breaks.
+        
+        Args:
+            words: Words to estimate
+        
+        Returns:
+            Estimated width of each word in pixels
+        """
+        advances = self._glyph_advances
+        for char in set(''.join(words)) - advances.keys():
+            # Characters the font has no glyph for report no metrics
+            metrics = self.font.metrics(char)[0]
+            advances[char] = metrics[4] if metrics else self.font.size(char)[0]
+        return [sum(map(advances.__getitem__, word)) for word in words]
+    
+    def _count_fitting_words(self, line, line_width, words, word_widths, start, max_width):
+        """
+        Count how many words from words[start:] fit on a line.
+        
+        Guesses the count from estimated word widths, then measures and
+        steps forward or back to the exact boundary, so a line takes a few
+        font.size() calls instead of one per word.
+        
+        Args:
+            line: Words already on the line
+            line_width: Estimated width of the words already on the line
+            words: All words being wrapped
+            word_widths: Estimated width of each word
+            start: Index of the first word to try
+            max_width: Maximum line width in pixels
+        
+        Returns:
+            Number of words that fit (0 if not even the first one does)
+        """
+        def fits(count):
+            # The joined line is measured as a whole: kerning makes it
+            # differ from the sum of the word widths
+            text = ' '.join(line + words[start:start + count])
+            return self.font.size(text)[0] <= max_width
+        
+        end = len(words)
+        
+        # Estimate from glyph advances
+        width_left = max_width - line_width
+        count = 0
+        while start + count < end:
+            width_left -= word_widths[start + count] + (self._space_width if line or count else 0)
+            if width_left < 0:
+                break
+            count += 1
+        
+        # Step to the exact boundary
+        if fits(count):
+            while start + count < end and fits(count + 1):
+                count += 1
+        else:
+            count -= 1
+            while count > 0 and not fits(count):
+                count -= 1
+        
+        return max(0, count)
+    
+    def _get_line_surfaces(self):
+        """
+        Get the rendered wrapped lines.
+        
+        Returns:
+            List of text surfaces, one per wrapped line
+        """
+        if self._line_surfaces is None or self._line_color != self.text_color:
+            self._line_surfaces = []
+            self._line_color = self.text_color
+        
+        # Render any lines added since the last call
+        for line in self.wrapped_lines[len(self._line_surfaces):]:
+            self._line_surfaces.append(
+                to_display_format(self.font.render(line, True, self.text_color), alpha=True)
+            )
+        return self._line_surfaces
     
     def handle_event(self, event):
         """
@@ -107,7 +266,10 @@ class TextBox:
         if not self.visible or not self.scrollable:
             return
         
-        if event.type == pygame.MOUSEWHEEL:
+        # Horizontal-only wheel events (y == 0) can't scroll, so skip them
+        # before asking for the mouse position. MOUSEWHEEL events carry no
+        # position of their own.
+        if event.type == pygame.MOUSEWHEEL and event.y:
             # Check if mouse is over text box
             mouse_pos = pygame.mouse.get_pos()
             if self.rect.collidepoint(mouse_pos):
@@ -135,28 +297,27 @@ class TextBox:
         # Draw border
         pygame.draw.rect(surface, self.border_color, self.rect, self.border_width)
         
-        # Create clipping rect for text (so it doesn't overflow)
-        clip_rect = pygame.Rect(
-            self.rect.x + self.padding,
-            self.rect.y + self.padding,
-            self.rect.width - (self.padding * 2),
-            self.rect.height - (self.padding * 2)
-        )
-        
-        # Save original clip
+        # Clip text to the area inside the padding (so it doesn't overflow),
+        # saving the original clip
         original_clip = surface.get_clip()
-        surface.set_clip(clip_rect)
-        
-        # Draw text lines
-        y_offset = self.rect.y + self.padding - self.scroll_offset
-        
-        for line in self.wrapped_lines:
-            # Only draw if visible
-            if y_offset + self.line_height >= self.rect.y and y_offset < self.rect.y + self.rect.height:
-                text_surface = self.font.render(line, True, self.text_color)
-                surface.blit(text_surface, (self.rect.x + self.padding, y_offset))
-            
-            y_offset += self.line_height
+        surface.set_clip(self._clip_rect)
+        
+        # Draw only the lines that overlap the box (a line is visible if
+        # its bottom is at or below the top edge and its top is above the
+        # bottom edge), found from the scroll offset
+        line_surfaces = self._get_line_surfaces()
+        line_height = self.line_height
+        top = self.padding - self.scroll_offset
+        first = max(0, -(top // line_height) - 1)
+        last = min(len(line_surfaces), -((top - self.rect.height) // line_height))
+        
+        x = self.rect.x + self.padding
+        y_offset = self.rect.y + top + first * line_height
+        blits = []
+        for text_surface in line_surfaces[first:last]:
+            blits.append((text_surface, (x, y_offset)))
+            y_offset += line_height
+        surface.blits(blits, doreturn=False)
         
         # Restore original clip
         surface.set_clip(original_clip)
@@ -170,15 +331,12 @@ class TextBox:
         indicator_width = 8
         indicator_x = self.rect.right - indicator_width - 5
         
-        # Calculate indicator height and position
-        visible_ratio = (self.rect.height - self.padding * 2) / (len(self.wrapped_lines) * self.line_height)
-        indicator_height = max(20, int((self.rect.height - self.padding * 2) * visible_ratio))
-        
+        # Calculate indicator position (its size is worked out when wrapping)
         scroll_ratio = self.scroll_offset / self.max_scroll if self.max_scroll > 0 else 0
-        indicator_y = self.rect.y + self.padding + int((self.rect.height - self.padding * 2 - indicator_height) * scroll_ratio)
+        indicator_y = self.rect.y + self.padding + int(self._indicator_travel * scroll_ratio)
         
         # Draw indicator
-        indicator_rect = pygame.Rect(indicator_x, indicator_y, indicator_width, indicator_height)
+        indicator_rect = pygame.Rect(indicator_x, indicator_y, indicator_width, self._indicator_height)
         pygame.draw.rect(surface, self.border_color, indicator_rect)
     
     def set_text(self, text):
@@ -199,13 +357,26 @@ class TextBox:
         Args:
             text: Text to append
         """
+        if self._wrap_state is None:
+            self.text += text
+            self._wrap_text()
+            return
+        
+        # Re-wrap only from the last word onwards (the appended text may
+        # continue that word). Lines before it are unchanged.
+        line_count, current_line, tail = self._wrap_state
         self.text += text
-        self._wrap_text()
+        del self.wrapped_lines[line_count:]
+        if self._line_surfaces is not None:
+            del self._line_surfaces[line_count:]
+        self._wrap_from(tail + text, current_line)
     
     def clear(self):
         """Clear all text."""
         self.text = ""
         self.wrapped_lines = []
+        self._line_surfaces = None
+        self._wrap_state = None
         self.scroll_offset = 0
         self.max_scroll = 0
     
@@ -213,11 +384,13 @@ class TextBox:
         """Set text box position."""
         self.rect.x = x
         self.rect.y = y
+        self._clip_rect.topleft = (x + self.padding, y + self.padding)
     
     def set_size(self, width, height):
         """Set text box size and re-wrap text."""
         self.rect.width = width
         self.rect.height = height
+        self._clip_rect.size = (width - self.padding * 2, height - self.padding * 2)
         self._wrap_text()
     
     def set_visible(self, visible):
@@ -250,7 +423,7 @@ class Label(TextBox):
             color: Text color
         """
         # Create font to measure text
-        font = pygame.font.Font(None, font_size)
+        font = get_font(font_size)
         text_surface = font.render(text, True, color)
         width, height = text_surface.get_size()
         
@@ -262,6 +435,18 @@ class Label(TextBox):
         self.text_color = color
         self.scrollable = False
     
+    def _wrap_text(self):
+        """Take the first line of text as is (labels don't wrap)."""
+        self.wrapped_lines = []
+        self._line_surfaces = None
+        self._wrap_state = None
+        
+        for paragraph in self.text.split('\n'):
+            words = paragraph.split()
+            if words:
+                self.wrapped_lines.append(' '.join(words))
+                break
+    
     def render(self, surface):
         """Draw label (just text, no background)."""
         if not self.visible:
@@ -269,7 +454,7 @@ class Label(TextBox):
         
         # Draw text only
         if self.wrapped_lines:
-            text_surface = self.font.render(self.wrapped_lines[0], True, self.text_color)
+            text_surface = self._get_line_surfaces()[0]
             surface.blit(text_surface, (self.rect.x + self.padding, self.rect.y + self.padding))
 
 
@@ -299,7 +484,7 @@ class MultilineLabel(Label):
             # Temporarily set width for wrapping
             old_width = self.rect.width
             self.rect.width = self.max_width
-            super()._wrap_text()
+            TextBox._wrap_text(self)
             
             # Resize to fit content
             height = len(self.wrapped_lines) * self.line_height + (self.padding * 2)
@@ -307,6 +492,18 @@ class MultilineLabel(Label):
         else:
             # No max width - split by newlines only
             self.wrapped_lines = self.text.split('\n') if self.text else []
+            self._line_surfaces = None
+            self._wrap_state = None
+    
+    def append_text(self, text):
+        """
+        Append text to existing content and resize to fit.
+        
+        Args:
+            text: Text to append
+        """
+        self.text += text
+        self._wrap_text()
     
     def render(self, surface):
         """Draw multi-line label."""
@@ -314,8 +511,7 @@ class MultilineLabel(Label):
             return
         
         y_offset = self.rect.y + self.padding
-        for line in self.wrapped_lines:
-            text_surface = self.font.render(line, True, self.text_color)
+        for text_surface in self._get_line_surfaces():
             surface.blit(text_surface, (self.rect.x + self.padding, y_offset))
             y_offset += self.line_height
 
@@ -345,7 +541,7 @@ class CenteredText:
         self.centered = centered
         self.visible = True
         
-        self.font = pygame.font.Font(None, font_size)
+        self.font = get_font(font_size)
         self._update_surface()
     
     def _update_surface(self):
@@ -0,0 +1,47 @@
+"""
+Text Cache
+Shared cache of rendered text surfaces.
+
+Menus and panels all over the game render the same strings (titles,
+option labels) in the same few fonts and colors. Rendering through
+render_text() keeps one surface per (text, size, color, font file)
+for all of them instead of one per widget.
+"""
+
+import pygame
+from functools import lru_cache
+from utils.resource_loader import get_font, resource_loader
+from utils.helpers import to_display_format
+
+
+# Number of rendered strings kept; the least recently used is dropped
+MAX_CACHED_TEXT = 512
+
+
+@lru_cache(maxsize=MAX_CACHED_TEXT)
+def render_text(text, size, color, filename=None) -> pygame.Surface:
+    """
+    Render antialiased text with a shared font, reusing earlier renders.
+
+    Surfaces are converted to the display format when they are cached.
+
+    Args:
+        text: Text to render
+        size: Font size
+        color: Text color (must be a tuple so it can be used as a key)
+        filename: Name of font file, or None for default font
+
+    Returns:
+        pygame.Surface with the text (shared, do not draw on it)
+    """
+    text_surface = get_font(size, filename).render(text, True, color)
+    return to_display_format(text_surface, alpha=True)
+
+
+def clear_text_cache():
+    """Drop all cached text, e.g. after fonts or themes change."""
+    render_text.cache_clear()
+
+
+# Cached surfaces were rendered with fonts the loader has dropped
+resource_loader.font_reset_callbacks.append(clear_text_cache)
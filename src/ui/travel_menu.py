@@ -8,12 +8,18 @@ from typing import Optional, Callable, List
 from world.island import Island, IslandConnection
 from ui.panel import Panel
 from ui.button import Button
+from ui.text_cache import render_text
+from utils.helpers import to_display_format
 from utils.constants import *
 
 
 class IslandCard:
     """Visual card for an island destination."""
 
+    # Font sizes (text is rendered through the shared text cache)
+    TITLE_FONT_SIZE = 24
+    TEXT_FONT_SIZE = 18
+
     def __init__(self, x: int, y: int, width: int, height: int):
         """Initialize island card."""
         self.rect = pygame.Rect(x, y, width, height)
@@ -28,15 +34,42 @@ class IslandCard:
         self.hover_color = LIGHT_GRAY
         self.locked_color = (60, 40, 40)
 
-        # Fonts
-        self.title_font = pygame.font.Font(None, 24)
-        self.text_font = pygame.font.Font(None, 18)
+        # Island text and positions, built in set_island
+        self._text_blits = []
+
+    def reset(self, x: int, y: int, width: int, height: int):
+        """Move the card and clear it so it can be reused for another island."""
+        self.rect.update(x, y, width, height)
+        self.island = None
+        self.connection = None
+        self.is_selected = False
+        self.is_hovered = False
+        self._text_blits = []
 
     def set_island(self, island: Island, connection: IslandConnection):
         """Set island to display."""
         self.island = island
         self.connection = connection
 
+        # Island details don't change while the card shows them, so the
+        # text is rendered and positioned once here
+        name_x = self.rect.x + 10
+        name_y = self.rect.y + 10
+
+        level_text = f"Lv. {island.recommended_level}"
+        cost_text = f"Cost: {connection.berries_cost:,} ฿"
+        cost_color = GREEN if connection.berries_cost == 0 else WHITE
+
+        self._text_blits = [
+            (render_text(island.name, self.TITLE_FONT_SIZE, WHITE), (name_x, name_y)),
+            (render_text(level_text, self.TEXT_FONT_SIZE, YELLOW), (name_x, name_y + 30)),
+            (render_text(cost_text, self.TEXT_FONT_SIZE, cost_color), (name_x, name_y + 50)),
+        ]
+        if island.visited:
+            self._text_blits.append(
+                (render_text("✓ Visited", self.TEXT_FONT_SIZE, CYAN), (name_x, name_y + 70))
+            )
+
     def set_selected(self, selected: bool):
         """Set selection state."""
         self.is_selected = selected
@@ -65,26 +98,8 @@ class IslandCard:
         # Draw background
         pygame.draw.rect(surface, bg, self.rect)
 
-        # Draw island name
-        name_text = self.title_font.render(self.island.name, True, WHITE)
-        name_x = self.rect.x + 10
-        name_y = self.rect.y + 10
-        surface.blit(name_text, (name_x, name_y))
-
-        # Draw recommended level
-        level_text = f"Lv. {self.island.recommended_level}"
-        level_surface = self.text_font.render(level_text, True, YELLOW)
-        surface.blit(level_surface, (name_x, name_y + 30))
-
-        # Draw travel cost
-        cost_text = f"Cost: {self.connection.berries_cost:,} ฿"
-        cost_surface = self.text_font.render(cost_text, True, GREEN if self.connection.berries_cost == 0 else WHITE)
-        surface.blit(cost_surface, (name_x, name_y + 50))
-
-        # Draw visited indicator
-        if self.island.visited:
-            visited_text = self.text_font.render("✓ Visited", True, CYAN)
-            surface.blit(visited_text, (name_x, name_y + 70))
+        # Draw island name, level, travel cost and visited indicator
+        surface.blits(self._text_blits, doreturn=False)
 
         # Draw border
         border_width = 3 if self.is_selected else 1
@@ -97,6 +112,10 @@ class TravelMenu:
     Shows available destinations and handles ship travel.
     """
 
+    # Font sizes (text is rendered through the shared text cache)
+    TITLE_FONT_SIZE = 36
+    INFO_FONT_SIZE = 20
+
     def __init__(self, screen_width: int, screen_height: int):
         """Initialize travel menu."""
         self.screen_width = screen_width
@@ -112,8 +131,15 @@ class TravelMenu:
         # Panel
         self.panel = Panel(self.panel_x, self.panel_y, self.panel_width, self.panel_height)
 
-        # Island cards
+        # Semi-transparent overlay, built once
+        self._overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+        self._overlay.fill((0, 0, 0, 200))
+        self._overlay = to_display_format(self._overlay, alpha=True)
+
+        # Island cards, and unused cards kept for the next set_destinations
         self.island_cards: List[IslandCard] = []
+        self._card_pool: List[IslandCard] = []
+        self._hovered_index = -1
         self.available_islands: List[Island] = []
         self.selected_index = 0
 
@@ -121,14 +147,28 @@ class TravelMenu:
         self.on_travel: Optional[Callable[[str], None]] = None
         self.on_close: Optional[Callable[[], None]] = None
 
-        # Fonts
-        self.title_font = pygame.font.Font(None, 36)
-        self.info_font = pygame.font.Font(None, 20)
+        # Title and controls hint never change, so they are rendered and
+        # positioned once
+        title_surface = render_text("Set Sail", self.TITLE_FONT_SIZE, WHITE)
+        title_x = self.panel_x + (self.panel_width - title_surface.get_width()) // 2
+        controls_text = "Arrow Keys: Navigate | Enter: Travel | T/Esc: Close"
+        controls_surface = render_text(controls_text, self.INFO_FONT_SIZE, LIGHT_GRAY)
+        controls_x = self.panel_x + (self.panel_width - controls_surface.get_width()) // 2
+        self._title_blit = (title_surface, (title_x, self.panel_y + 15))
+        self._controls_blit = (controls_surface, (controls_x, self.panel_y + self.panel_height - 15))
 
         # Current island info
         self.current_island: Optional[Island] = None
         self.player_berries = 0
 
+        # Location and berries text, rebuilt when the values change
+        self._location_blit = None
+        self._berries_value = None
+        self._berries_blit = None
+
+        # Description of the selected island, rebuilt when the selection changes
+        self._description_blit = None
+
         # Buttons
         self._create_buttons()
 
@@ -166,6 +206,14 @@ class TravelMenu:
         self.available_islands = available
         self.player_berries = player_berries
 
+        self._location_blit = None
+        if current_island:
+            location_text = f"Current: {current_island.name}"
+            self._location_blit = (
+                render_text(location_text, self.INFO_FONT_SIZE, CYAN),
+                (self.panel_x + 20, self.panel_y + 55)
+            )
+
         # Create island cards
         self._create_island_cards(connections)
 
@@ -174,8 +222,10 @@ class TravelMenu:
         self._update_selection()
 
     def _create_island_cards(self, connections: List[IslandConnection]):
-        """Create visual island cards."""
+        """Create visual island cards, reusing cards from earlier calls."""
+        self._card_pool.extend(self.island_cards)
         self.island_cards.clear()
+        self._hovered_index = -1
 
         card_width = 320
         card_height = 100
@@ -185,6 +235,9 @@ class TravelMenu:
         start_x = self.panel_x + 20
         start_y = self.panel_y + 80
 
+        # Connection per destination (reversed so the first match wins)
+        connections_by_id = {conn.destination_island: conn for conn in reversed(connections)}
+
         for i, island in enumerate(self.available_islands):
             row = i // cards_per_row
             col = i % cards_per_row
@@ -192,18 +245,20 @@ class TravelMenu:
             x = start_x + col * (card_width + spacing)
             y = start_y + row * (card_height + spacing)
 
-            card = IslandCard(x, y, card_width, card_height)
+            if self._card_pool:
+                card = self._card_pool.pop()
+                card.reset(x, y, card_width, card_height)
+            else:
+                card = IslandCard(x, y, card_width, card_height)
 
             # Find connection for this island
-            connection = None
-            for conn in connections:
-                if conn.destination_island == island.island_id:
-                    connection = conn
-                    break
+            connection = connections_by_id.get(island.island_id)
 
             if connection:
                 card.set_island(island, connection)
                 self.island_cards.append(card)
+            else:
+                self._card_pool.append(card)
 
     def show(self):
         """Show the menu."""
@@ -254,14 +309,19 @@ class TravelMenu:
         elif event.type == pygame.MOUSEMOTION:
             mouse_x, mouse_y = event.pos
 
-            # Update hover state
+            # Update hover state (only the cards entering or leaving hover)
             new_hovered = -1
             for i, card in enumerate(self.island_cards):
                 if card.contains_point(mouse_x, mouse_y):
                     new_hovered = i
-                    card.set_hovered(True)
-                else:
-                    card.set_hovered(False)
+                    break
+
+            if new_hovered != self._hovered_index:
+                if self._hovered_index >= 0:
+                    self.island_cards[self._hovered_index].set_hovered(False)
+                if new_hovered >= 0:
+                    self.island_cards[new_hovered].set_hovered(True)
+                self._hovered_index = new_hovered
 
         elif event.type == pygame.MOUSEBUTTONDOWN:
             mouse_x, mouse_y = event.pos
@@ -289,11 +349,17 @@ class TravelMenu:
         for i, card in enumerate(self.island_cards):
             card.set_selected(i == self.selected_index)
 
-        # Update travel button state
+        # Update travel button state and description
+        self._description_blit = None
         if 0 <= self.selected_index < len(self.island_cards):
             card = self.island_cards[self.selected_index]
             can_afford = self.player_berries >= card.connection.berries_cost
             self.travel_button.set_enabled(can_afford)
+
+            if card.island:
+                desc_y = self.panel_y + self.panel_height - 120
+                desc_surface = render_text(card.island.description, self.INFO_FONT_SIZE, LIGHT_GRAY)
+                self._description_blit = (desc_surface, (self.panel_x + 20, desc_y))
         else:
             self.travel_button.set_enabled(False)
 
@@ -314,50 +380,38 @@ class TravelMenu:
             return
 
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
+        surface.blit(self._overlay, (0, 0))
 
         # Draw panel
         self.panel.render(surface)
 
         # Draw title
-        title_text = self.title_font.render("Set Sail", True, WHITE)
-        title_x = self.panel_x + (self.panel_width - title_text.get_width()) // 2
-        surface.blit(title_text, (title_x, self.panel_y + 15))
+        surface.blit(*self._title_blit)
 
         # Draw current location
-        if self.current_island:
-            location_text = f"Current: {self.current_island.name}"
-            location_surface = self.info_font.render(location_text, True, CYAN)
-            surface.blit(location_surface, (self.panel_x + 20, self.panel_y + 55))
-
-        # Draw berries
-        berries_text = f"Berries: {self.player_berries:,} ฿"
-        berries_surface = self.info_font.render(berries_text, True, YELLOW)
-        berries_x = self.panel_x + self.panel_width - berries_surface.get_width() - 20
-        surface.blit(berries_surface, (berries_x, self.panel_y + 55))
+        if self._location_blit:
+            surface.blit(*self._location_blit)
+
+        # Draw berries (right-aligned, re-rendered only when the amount changes)
+        if self.player_berries != self._berries_value:
+            berries_text = f"Berries: {self.player_berries:,} ฿"
+            berries_surface = render_text(berries_text, self.INFO_FONT_SIZE, YELLOW)
+            berries_x = self.panel_x + self.panel_width - berries_surface.get_width() - 20
+            self._berries_blit = (berries_surface, (berries_x, self.panel_y + 55))
+            self._berries_value = self.player_berries
+        surface.blit(*self._berries_blit)
 
         # Draw island cards
         for card in self.island_cards:
             card.render(surface)
 
         # Draw selected island description
-        if 0 <= self.selected_index < len(self.island_cards):
-            card = self.island_cards[self.selected_index]
-            if card.island:
-                desc_y = self.panel_y + self.panel_height - 120
-                desc_text = card.island.description
-                desc_surface = self.info_font.render(desc_text, True, LIGHT_GRAY)
-                surface.blit(desc_surface, (self.panel_x + 20, desc_y))
+        if self._description_blit:
+            surface.blit(*self._description_blit)
 
         # Draw buttons
         self.travel_button.render(surface)
         self.close_button.render(surface)
 
         # Draw controls hint
-        controls_text = "Arrow Keys: Navigate | Enter: Travel | T/Esc: Close"
-        controls_surface = self.info_font.render(controls_text, True, LIGHT_GRAY)
-        controls_x = self.panel_x + (self.panel_width - controls_surface.get_width()) // 2
-        surface.blit(controls_surface, (controls_x, self.panel_y + self.panel_height - 15))
+        surface.blit(*self._controls_blit)
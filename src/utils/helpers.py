@@ -5,6 +5,15 @@ Common utility functions used throughout the game.
 
 import pygame
 import os
+from functools import lru_cache
+
+
+# Directory get_file_path resolves against (the parent of utils/),
+# worked out once at import
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Number of surfaces draw_text keeps; the least recently used is dropped
+MAX_CACHED_DRAW_TEXT = 512
 
 
 def clamp(value, min_value, max_value):
@@ -45,9 +54,25 @@ def distance(pos1, pos2):
     Returns:
         Distance as float
     """
+    return distance_sq(pos1, pos2) ** 0.5
+
+
+def distance_sq(pos1, pos2):
+    """Calculate the squared distance between two positions.
+    
+    Cheaper than distance() for range checks: compare against the
+    squared range instead (distance_sq(a, b) <= r * r).
+    
+    Args:
+        pos1: First position (x, y)
+        pos2: Second position (x, y)
+    
+    Returns:
+        Squared distance
+    """
     dx = pos2[0] - pos1[0]
     dy = pos2[1] - pos1[1]
-    return (dx * dx + dy * dy) ** 0.5
+    return dx * dx + dy * dy
 
 
 def rect_collision(rect1, rect2):
@@ -76,9 +101,27 @@ def point_in_rect(point, rect):
     return rect.collidepoint(point)
 
 
+@lru_cache(maxsize=MAX_CACHED_DRAW_TEXT)
+def _render_font_text(font, text, color):
+    """Render antialiased text, reusing earlier renders of the same font.
+
+    Keyed on the font object itself, which also keeps it alive while its
+    renders are cached.
+    """
+    return font.render(text, True, color)
+
+
+def clear_draw_text_cache():
+    """Drop the surfaces cached by draw_text, e.g. after fonts are reloaded."""
+    _render_font_text.cache_clear()
+
+
 def draw_text(surface, text, font, color, position, centered=False):
     """Draw text on a surface.
     
+    Rendered text is cached per (font, text, color), so labels drawn
+    every frame are only rasterized once.
+    
     Args:
         surface: Surface to draw on
         text: Text string to draw
@@ -87,7 +130,7 @@ def draw_text(surface, text, font, color, position, centered=False):
         position: Position (x, y)
         centered: If True, center text at position
     """
-    text_surface = font.render(text, True, color)
+    text_surface = _render_font_text(font, text, tuple(pygame.Color(color)))
     text_rect = text_surface.get_rect()
     
     if centered:
@@ -111,28 +154,45 @@ def create_gradient_surface(width, height, start_color, end_color, vertical=True
     Returns:
         pygame.Surface with gradient
     """
-    surface = pygame.Surface((width, height))
-    
-    if vertical:
-        for y in range(height):
-            progress = y / height
-            color = (
-                int(lerp(start_color[0], end_color[0], progress)),
-                int(lerp(start_color[1], end_color[1], progress)),
-                int(lerp(start_color[2], end_color[2], progress))
-            )
-            pygame.draw.line(surface, color, (0, y), (width, y))
-    else:
-        for x in range(width):
-            progress = x / width
-            color = (
-                int(lerp(start_color[0], end_color[0], progress)),
-                int(lerp(start_color[1], end_color[1], progress)),
-                int(lerp(start_color[2], end_color[2], progress))
-            )
-            pygame.draw.line(surface, color, (x, 0), (x, height))
+    if width <= 0 or height <= 0:
+        return pygame.Surface((width, height))
+
+    # Work out each band's color once into a one-pixel strip, then
+    # stretch the strip across the other axis in a single scale
+    steps = height if vertical else width
+    strip = pygame.Surface((1, steps) if vertical else (steps, 1))
+    set_at = strip.set_at
+
+    # Same arithmetic as lerp(), with the per-channel deltas hoisted
+    r, g, b = start_color[0], start_color[1], start_color[2]
+    dr = end_color[0] - r
+    dg = end_color[1] - g
+    db = end_color[2] - b
+
+    for i in range(steps):
+        progress = i / steps
+        color = (int(r + dr * progress), int(g + dg * progress), int(b + db * progress))
+        set_at((0, i) if vertical else (i, 0), color)
+
+    return pygame.transform.scale(strip, (width, height))
+
+
+def to_display_format(surface, alpha=False):
+    """Convert a surface to the display's pixel format for faster blits.
+    
+    Surfaces that don't match the display format are converted pixel by
+    pixel on every blit. Does nothing if no display mode has been set yet.
     
-    return surface
+    Args:
+        surface: Surface to convert
+        alpha: If True, keep per-pixel alpha (convert_alpha)
+    
+    Returns:
+        Converted surface, or the original if there is no display
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
 
 
 def format_time(seconds):
@@ -170,12 +230,7 @@ def get_file_path(*path_parts):
     Returns:
         Absolute file path
     """
-    # Get the directory containing this file
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    # Go up to the src directory, then project root
-    project_root = os.path.dirname(current_dir)
-    # Join with provided path parts
-    return os.path.join(project_root, *path_parts)
+    return os.path.join(_PROJECT_ROOT, *path_parts)
 
 
 def ensure_directory_exists(directory_path):
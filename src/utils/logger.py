@@ -3,16 +3,70 @@ Logging Utility
 Provides centralized logging for the entire game.
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+
+# Write buffer for log files; records below WARNING wait in it
+LOG_FILE_BUFFER_SIZE = 128 * 1024
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that opens its file with a large write buffer.
+    
+    logging.FileHandler flushes after every record. This one only
+    flushes on records at flush_level or above (and when closed), so
+    the debug stream reaches disk in a few large writes while warnings
+    and errors are still written out immediately.
+    """
+    
+    def __init__(self, filename, mode='a', encoding=None, flush_level=logging.WARNING):
+        """
+        Initialize the handler.
+        
+        Args:
+            filename: Path to the log file
+            mode: File open mode
+            encoding: File encoding
+            flush_level: Records at this level or above flush the buffer
+        """
+        self.flush_level = flush_level
+        super().__init__(filename, mode, encoding)
+    
+    def _open(self):
+        """Open the log file with the larger buffer."""
+        return open(self.baseFilename, self.mode, buffering=LOG_FILE_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record):
+        """Write a record, flushing only for important records."""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 class GameLogger:
     """
     Centralized logging system for the game.
     Logs to both console and file with different levels.
+    
+    Console output is written straight away, in order with print().
+    File records are only put on a queue; a background listener thread
+    writes them to the log files, so the game loop never waits on disk
+    I/O.
     """
     
     def __init__(self, name="OnePieceRPG", log_dir="logs", console_level=logging.INFO, file_level=logging.DEBUG):
@@ -60,21 +114,48 @@ class GameLogger:
             log_dir,
             f"game_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
         )
-        file_handler = logging.FileHandler(session_log_file, encoding='utf-8')
+        file_handler = BufferedFileHandler(session_log_file, encoding='utf-8')
         file_handler.setLevel(file_level)
         file_handler.setFormatter(detailed_formatter)
-        self.logger.addHandler(file_handler)
         
         # Also create/append to a general log file
         general_log_file = os.path.join(log_dir, "game_general.log")
-        general_handler = logging.FileHandler(general_log_file, encoding='utf-8')
+        general_handler = BufferedFileHandler(general_log_file, encoding='utf-8')
         general_handler.setLevel(logging.INFO)
         general_handler.setFormatter(detailed_formatter)
-        self.logger.addHandler(general_handler)
+        
+        # Hand records to the file handlers on a background thread.
+        # Records below both files' levels are dropped before queueing.
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(min(file_level, logging.INFO))
+        self.logger.addHandler(queue_handler)
+        
+        self._listener = QueueListener(
+            log_queue, file_handler, general_handler,
+            respect_handler_level=True
+        )
+        self._listener.start()
+        self._file_handlers = (file_handler, general_handler)
+        atexit.register(self.close)
         
         self.session_log_file = session_log_file
         self.general_log_file = general_log_file
     
+    def close(self):
+        """Write out queued records and close the log files.
+        
+        Called automatically at exit. Safe to call more than once.
+        """
+        if self._listener is None:
+            return
+        
+        self._listener.stop()
+        self._listener = None
+        for handler in self._file_handlers:
+            handler.close()
+        atexit.unregister(self.close)
+    
     def debug(self, message):
         """Log debug message."""
         self.logger.debug(message)
@@ -136,6 +217,8 @@ def init_logger(name="OnePieceRPG", log_dir="logs", console_level=logging.INFO,
         GameLogger instance
     """
     global _global_logger
+    if _global_logger is not None:
+        _global_logger.close()
     _global_logger = GameLogger(name, log_dir, console_level, file_level)
     return _global_logger
 
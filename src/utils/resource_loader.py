@@ -5,7 +5,7 @@ Handles loading and caching of game assets (images, sounds, fonts, etc.)
 
 import pygame
 import os
-from utils.helpers import get_file_path
+from utils.helpers import get_file_path, clear_draw_text_cache
 
 
 class ResourceLoader:
@@ -31,6 +31,10 @@ class ResourceLoader:
         self.music = {}
         self.fonts = {}
         
+        # Called whenever cached fonts are dropped, so caches of text
+        # rendered from them can be dropped too
+        self.font_reset_callbacks = []
+        
         # Asset paths
         self.assets_path = get_file_path("assets")
         self.sprites_path = os.path.join(self.assets_path, "sprites")
@@ -181,17 +185,47 @@ class ResourceLoader:
                 print(f"Failed to load font '{filename}', using default")
                 font = pygame.font.Font(None, size)
         
+        # Fonts are only valid while the font module is initialized, and
+        # using one after pygame.quit() crashes. Drop them when pygame
+        # quits; quit hooks run once, so re-register for each new cache.
+        if not self.fonts:
+            pygame.register_quit(self.clear_fonts)
+        
         self.fonts[cache_key] = font
         return font
     
+    def clear_fonts(self):
+        """Drop cached fonts and any text cached from them."""
+        self.fonts.clear()
+        clear_draw_text_cache()
+        for callback in self.font_reset_callbacks:
+            callback()
+    
     def clear_cache(self):
         """Clear all cached resources."""
         self.images.clear()
         self.sounds.clear()
         self.music.clear()
-        self.fonts.clear()
+        self.clear_fonts()
         print("Resource cache cleared")
 
 
 # Global instance
 resource_loader = ResourceLoader()
+
+
+def get_font(size, filename=None):
+    """Get a shared font instance from the global resource loader.
+    
+    UI components should use this instead of constructing
+    pygame.font.Font directly so that every widget asking for the same
+    face and size shares one Font (and its glyph cache).
+    
+    Args:
+        size: Font size
+        filename: Name of font file, or None for default font
+    
+    Returns:
+        pygame.font.Font
+    """
+    return resource_loader.load_font(filename, size)